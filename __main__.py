@@ -0,0 +1,4 @@
+"""Lets the repository directory run as a program: python . [variant] [options]."""
+from frog_play import main
+
+main()
@@ -0,0 +1,10 @@
+from frog_play import play
+from frog_variants import variant_config
+
+# Settings live in frog_variants.VARIANTS["endless"]
+CONFIG = variant_config("endless")
+
+
+# Run the game
+if __name__ == "__main__":
+    play(CONFIG)
@@ -0,0 +1,348 @@
+"""Many Frog Jump games stepped in lockstep with NumPy.
+
+BatchSimulation keeps N independent games as struct-of-arrays and advances
+all of them with one step(actions) call, following the same rules as
+frog_sim.Simulation for the given GameConfig, including its swept knight
+and ball collisions, so large steps behave alike. Games that end are reset in
+place so the batch always stays full. Meant for bot training and balance
+runs, where thousands of games have to tick without any window. Endless
+mode, which scrolls and recycles rows, is not supported.
+"""
+import numpy as np
+
+from frog_sim import DOWN, JUMP, LEFT, RIGHT, GameConfig
+
+# Action value for "no key pressed this tick"
+NOOP = -1
+
+# Values of the outcome array returned by step()
+PLAYING = 0
+WON = 1
+LOST = 2
+
+
+class BatchSimulation:
+    """N Frog Jump games advanced together, one action per game per tick."""
+
+    def __init__(self, num_games, config=None, seed=None):
+        self.config = cfg = config or GameConfig()
+        if cfg.endless:
+            raise ValueError("BatchSimulation has no endless mode: its games do not scroll")
+        self.num_games = num_games
+        self.rng = np.random.default_rng(seed)
+        shape = (num_games, cfg.num_rows, cfg.num_logs_per_row)
+
+        self.row_y = np.array([cfg.row_y(row) for row in range(cfg.num_rows)], dtype=np.float64)
+        self.start_log_x = np.array(cfg.initial_log_xs(), dtype=np.float64)
+        self.log_x = np.empty(shape)
+        self.log_speed = np.empty(shape)
+        self.knight_x = np.empty(num_games)
+        self.knight_y = np.empty(num_games)
+        self.velocity_y = np.empty(num_games)
+        self.knight_dy = np.zeros(num_games)  # How far each knight fell this tick
+        self.on_log = np.empty(num_games, dtype=bool)
+        self.falling = np.empty(num_games, dtype=bool)
+        self.bounced = np.empty(num_games, dtype=bool)
+        self.chest_x = np.empty(num_games)
+        self.chest_y = np.empty(num_games)
+        self.ball_x = np.zeros((num_games, max(cfg.max_balls, 1)))
+        self.ball_y = np.zeros((num_games, max(cfg.max_balls, 1)))
+        self.ball_active = np.zeros((num_games, max(cfg.max_balls, 1)), dtype=bool)
+        self.spawn_countdown = np.empty(num_games, dtype=np.int64)
+        self.score = np.empty(num_games, dtype=np.int64)
+        self.ticks = np.empty(num_games, dtype=np.int64)
+        self.all_games = np.arange(num_games)
+        self.reset(np.ones(num_games, dtype=bool))
+
+    def reset(self, mask):
+        """Start fresh games in the slots selected by a boolean mask."""
+        cfg = self.config
+        count = int(mask.sum())
+        if not count:
+            return
+        self.log_x[mask] = self.start_log_x
+        speed = cfg.initial_log_speed
+        size = (count, cfg.num_rows, cfg.num_logs_per_row)
+        if cfg.log_speed_mode == "sign":
+            self.log_speed[mask] = np.where(self.rng.random(size) < 0.5, speed, -speed)
+        else:
+            self.log_speed[mask] = self.rng.uniform(-speed, speed, size)
+        self.knight_x[mask] = cfg.knight_start_x
+        self.knight_y[mask] = cfg.window_height - cfg.jump_distance - cfg.knight_height
+        self.velocity_y[mask] = 0
+        self.on_log[mask] = cfg.anchor_knight
+        self.falling[mask] = False
+        self.bounced[mask] = False
+        self.place_chest(mask)
+        self.ball_active[mask] = False
+        self.spawn_countdown[mask] = 0
+        self.score[mask] = 0
+        self.ticks[mask] = 0
+
+    def random_logs(self, mask):
+        """A random (row, column) for every game selected by the mask."""
+        cfg = self.config
+        count = int(mask.sum())
+        rows = self.rng.integers(0, cfg.num_rows, count)
+        cols = self.rng.integers(0, cfg.num_logs_per_row, count)
+        return rows, cols
+
+    def place_chest(self, mask):
+        """Place the chest above a random log in every masked game."""
+        cfg = self.config
+        games = self.all_games[mask]
+        rows, cols = self.random_logs(mask)
+        self.chest_x[games] = self.log_x[games, rows, cols] + (cfg.log_width - cfg.knight_width) // 2
+        self.chest_y[games] = np.maximum(self.row_y[rows] - cfg.knight_height - 10, 0)
+
+    def step(self, actions):
+        """Apply one action per game and advance every game by a tick.
+
+        actions holds LEFT, RIGHT, JUMP, DOWN or NOOP for each game. Returns
+        (rewards, outcomes): the score change of each game this tick, and
+        WON/LOST for the games that ended, which have already been reset.
+        """
+        cfg = self.config
+        actions = np.asarray(actions)
+        score_before = self.score.copy()
+        outcome = np.zeros(self.num_games, dtype=np.int8)
+
+        self.apply_actions(actions, outcome)
+        playing = outcome == PLAYING
+
+        self.ticks += 1
+        self.move_logs()
+        if cfg.log_collisions:
+            self.handle_log_collisions()
+        self.update_knight()
+        self.update_balls(playing)
+        if cfg.chest_every_tick:
+            self.collect_chest(playing)
+
+        fall_limit = cfg.window_height if cfg.fall_limit is None else cfg.fall_limit
+        outcome[playing & (self.knight_y >= fall_limit)] = LOST
+        self.spawn_balls()
+
+        rewards = self.score - score_before
+        self.reset(outcome != PLAYING)
+        return rewards, outcome
+
+    def apply_actions(self, actions, outcome):
+        cfg = self.config
+        step = np.where(actions == LEFT, -cfg.move_step, np.where(actions == RIGHT, cfg.move_step, 0))
+        jump = actions == JUMP
+        if cfg.jump_mode == "launch":
+            # Jumping needs a log to push off from
+            jump &= self.on_log
+            self.velocity_y[jump] = cfg.fast_fall_velocity
+        self.move_knight(step != 0, step, 0, outcome)
+        self.move_knight(jump, 0, -cfg.jump_distance, outcome)
+        if cfg.jump_mode == "launch":
+            self.on_log[jump] = False
+
+        down = actions == DOWN
+        if cfg.fall_mode == "fast":
+            self.falling |= down
+        elif cfg.fall_mode == "next_row":
+            self.drop_to_next_row(down)
+        elif cfg.fall_mode == "random_log":
+            games = self.all_games[down]
+            rows, cols = self.random_logs(down)
+            self.knight_x[games] = self.log_x[games, rows, cols]
+            self.knight_y[games] = self.row_y[rows]
+            self.velocity_y[games] = 0
+            self.on_log[games] = True
+        elif cfg.fall_mode == "drop":
+            drop = down & ~self.on_log
+            self.on_log |= drop
+            self.velocity_y[drop] = 0
+            self.knight_y[drop] += cfg.jump_distance
+
+    def move_knight(self, mask, dx, dy, outcome):
+        """Move the masked knights and check for victory, gravity and the chest."""
+        cfg = self.config
+        self.knight_x += np.where(mask, dx, 0)
+        self.knight_y += np.where(mask, dy, 0)
+        if not cfg.move_checks:
+            return
+        won = mask & (self.knight_y <= 0)
+        outcome[won] = WON
+        mask = mask & ~won
+        if cfg.gravity_on_move:
+            self.velocity_y[mask & ~self.on_log] += cfg.gravity
+        self.collect_chest(mask)
+
+    def drop_to_next_row(self, mask):
+        """Drop masked knights onto the row below if a log there is under them."""
+        cfg = self.config
+        feet = self.knight_y + cfg.knight_height
+        row = np.ceil((cfg.window_height - feet) / cfg.jump_distance - 1).astype(np.int64)
+        row = np.clip(row, 0, cfg.num_rows - 1)
+        mask = mask & (row > 0)
+        games = self.all_games[mask]
+        below = row[mask] - 1
+        log_x = self.log_x[games, below]
+        under = (log_x <= self.knight_x[games, None] + cfg.knight_width) & \
+                (log_x + cfg.log_width >= self.knight_x[games, None])
+        landed = under.any(axis=1)
+        games = games[landed]
+        self.knight_y[games] = self.row_y[below[landed]] - cfg.knight_height
+        self.velocity_y[games] = 0
+
+    def move_logs(self):
+        """Move every log and bounce it off the walls."""
+        cfg = self.config
+        self.log_x += self.log_speed
+        hit = (self.log_x + cfg.log_width >= cfg.window_width) | (self.log_x <= 0)
+        np.negative(self.log_speed, out=self.log_speed, where=hit)
+
+    def handle_log_collisions(self):
+        """Reverse a log's speed once for every log it touches in its row."""
+        gap = np.abs(self.log_x[..., :, None] - self.log_x[..., None, :])
+        hits = (gap <= self.config.log_width).sum(axis=-1) - 1  # A log always touches itself
+        np.negative(self.log_speed, out=self.log_speed, where=(hits % 2).astype(bool))
+
+    def update_knight(self):
+        """Land knights on logs, carry them along, and apply gravity."""
+        cfg = self.config
+        if cfg.anchor_knight:
+            # Knights on a log ride along with the first log of the first row
+            riding = self.on_log
+            self.knight_x[riding] = self.log_x[riding, 0, 0]
+            airborne = ~riding
+        else:
+            self.check_knight_on_log()
+            airborne = self.falling | ~self.on_log
+
+        self.velocity_y[airborne] += cfg.gravity
+        if cfg.max_fall_velocity is not None:
+            np.minimum(self.velocity_y, cfg.max_fall_velocity, out=self.velocity_y, where=airborne)
+        if cfg.anchor_knight:
+            self.knight_dy = np.where(airborne, self.velocity_y, 0)
+        else:
+            self.knight_dy = self.swept_fall(self.velocity_y)
+        self.knight_y += self.knight_dy
+
+    def swept_fall(self, dy):
+        """How far each knight moves when falling by dy, stopping at the first log hit.
+
+        The batch form of Simulation.knight_time_of_impact: knights already
+        overlapping a log at the start of the move fall the whole way.
+        """
+        cfg = self.config
+        kx = self.knight_x[:, None, None]
+        ky1 = self.knight_y[:, None, None]
+        ky2 = ky1 + cfg.knight_height
+        ly1 = self.row_y[None, :, None]
+        ly2 = ly1 + cfg.log_height
+        above = (kx + cfg.knight_width >= self.log_x) & (kx <= self.log_x + cfg.log_width)
+        started = (above & (ky2 >= ly1) & (ky1 <= ly2)).reshape(self.num_games, -1).any(axis=1)
+        step = np.where(dy == 0, 1, dy)[:, None, None]
+        down = step > 0
+        t_in = np.where(down, ly1 - ky2, ly2 - ky1) / step
+        t_out = np.where(down, ly2 - ky1, ly1 - ky2) / step
+        t = np.where(above & (t_in >= 0) & (t_in <= 1) & (t_in <= t_out), t_in, np.inf)
+        t = t.reshape(self.num_games, -1)
+        first = t.argmin(axis=1)
+        hit = np.isfinite(t[self.all_games, first]) & ~started & (dy != 0)
+        rows = first // cfg.num_logs_per_row
+        # Stop on the surface of the log instead of passing through it
+        surface = np.where(dy > 0, self.row_y[rows] - (self.knight_y + cfg.knight_height),
+                           self.row_y[rows] + cfg.log_height - self.knight_y)
+        return np.where(hit, surface, dy)
+
+    def check_knight_on_log(self):
+        """Find the first log each knight touches and move the knight with it."""
+        cfg = self.config
+        kx = self.knight_x[:, None, None]
+        ky = self.knight_y[:, None, None]
+        row_y = self.row_y[None, :, None]
+        touching = ((kx + cfg.knight_width >= self.log_x) & (kx <= self.log_x + cfg.log_width) &
+                    (ky + cfg.knight_height >= row_y) & (ky <= row_y + cfg.log_height))
+        touching = touching.reshape(self.num_games, -1)
+        first = touching.argmax(axis=1)
+        landed = touching[self.all_games, first]
+        speed = self.log_speed.reshape(self.num_games, -1)[self.all_games, first]
+        self.knight_x += np.where(landed, speed * cfg.carry_factor, 0)
+        if cfg.bounce_velocity is None:
+            self.velocity_y[landed] = 0  # Stop falling when on log
+        else:
+            self.velocity_y[landed & ~self.bounced] = cfg.bounce_velocity
+            self.bounced = landed  # Only bounce once per landing
+        self.on_log = landed
+
+    def collect_chest(self, mask):
+        """Score the chest for masked knights touching it and place new ones."""
+        cfg = self.config
+        found = mask & self.touching(self.chest_x, self.chest_y, cfg.knight_width, cfg.knight_height)
+        if found.any():
+            self.score[found] += cfg.chest_reward
+            self.place_chest(found)
+
+    def touching(self, x, y, width, height):
+        """Whether each knight touches a box of the given size at (x, y)."""
+        cfg = self.config
+        kx = self.knight_x.reshape(self.knight_x.shape + (1,) * (x.ndim - 1))
+        ky = self.knight_y.reshape(kx.shape)
+        return ~((kx + cfg.knight_width < x) | (kx > x + width) |
+                 (ky + cfg.knight_height < y) | (ky > y + height))
+
+    def ball_size(self):
+        radius = self.config.ball_radius
+        return radius * 2 if self.config.ball_mode == "rain" else radius
+
+    def update_balls(self, playing):
+        """Move balls down and charge the knights they hit."""
+        cfg = self.config
+        if cfg.max_balls <= 0:
+            return
+        self.ball_y[self.ball_active] += cfg.ball_speed
+        size = self.ball_size()
+        hit = self.ball_active & (self.touching(self.ball_x, self.ball_y, size, size) | self.balls_swept(size))
+        self.score -= np.where(playing, hit.sum(axis=1) * cfg.ball_penalty, 0)
+        self.ball_active &= ~hit & (self.ball_y < cfg.window_height)
+
+    def balls_swept(self, size):
+        """Which balls passed through their knight during this tick.
+
+        The batch form of Simulation.ball_swept_knight: each ball's move is
+        taken relative to its knight's fall.
+        """
+        cfg = self.config
+        kx = self.knight_x[:, None]
+        ky1 = self.knight_y[:, None]
+        ky2 = ky1 + cfg.knight_height
+        dy = cfg.ball_speed - self.knight_dy[:, None]
+        by1 = self.ball_y - dy  # Where the ball started, relative to the knight
+        by2 = by1 + size
+        step = np.where(dy == 0, 1, dy)
+        down = step > 0
+        t_in = np.where(down, ky1 - by2, ky2 - by1) / step
+        t_out = np.where(down, ky2 - by1, ky1 - by2) / step
+        across = (kx + cfg.knight_width >= self.ball_x) & (kx <= self.ball_x + size)
+        return across & (dy != 0) & (t_in >= 0) & (t_in <= 1) & (t_in <= t_out)
+
+    def spawn_balls(self):
+        """Spawn falling balls, up to the variant's limit."""
+        cfg = self.config
+        if cfg.max_balls <= 0:
+            return
+        free = ~self.ball_active
+        if cfg.ball_mode == "rain":
+            self.spawn_countdown -= 1
+            due = self.spawn_countdown <= 0
+            self.spawn_countdown[due] = cfg.ball_spawn_interval
+            spawn = due & free.any(axis=1)
+            games = self.all_games[spawn]
+            x = self.rng.integers(0, cfg.window_width - cfg.ball_radius + 1, len(games))
+            y = 0
+        else:
+            spawn = (self.rng.random(self.num_games) < cfg.ball_spawn_chance) & free.any(axis=1)
+            games = self.all_games[spawn]
+            rows, cols = self.random_logs(spawn)
+            x = self.log_x[games, rows, cols] + (cfg.log_width - cfg.ball_radius) // 2
+            y = self.row_y[rows] - cfg.ball_radius
+        slot = free[games].argmax(axis=1)
+        self.ball_x[games, slot] = x
+        self.ball_y[games, slot] = y
+        self.ball_active[games, slot] = True
@@ -0,0 +1,281 @@
+"""Scaling benchmark for the headless tick logic of every variant.
+
+Each point plays seeded games of one variant with the hopper policy from
+frog_tune.py, at a given number of rows, logs per row and ball slots. The
+window grows with the point so the logs keep their spacing. For every
+point it measures:
+
+    ticks_per_sec         steps per second, game setup not counted
+    alloc_bytes_per_tick  memory allocated and freed again inside a tick
+                          (tracemalloc peak above the heap before the tick)
+    live_blocks_per_tick  memory blocks a tick leaves behind (leaks), counted
+                          around the steps only, not the game resets
+    peak_rss_kb           peak resident memory of the process running the point
+
+Points run one after another, each in a fresh process so peak RSS belongs
+to that point alone. Cold start is measured too: the median time a fresh
+interpreter takes to import the simulation and run a first tick, and
+whether that pulled in tkinter or NumPy. Results are written as JSON; with
+--compare, points that got slower or allocate more than in a saved
+baseline, and a slower or heavier cold start, are flagged and the exit
+status is 1.
+
+Examples:
+    python frog_bench.py --results baseline.json
+    python frog_bench.py --variant game --size 100x100x1000 --compare baseline.json
+    python frog_bench.py --no-run --results new.json --compare baseline.json
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Not on Windows; peak RSS is then left out
+    resource = None
+
+from frog_sim import GameConfig, Simulation
+from frog_tune import hopper_policy
+from frog_variants import VARIANTS, variant_config
+
+# Rows x logs per row x ball slots, from the default layout up to 11,000 entities
+SIZES = ("6x3x0", "6x3x3", "20x10x50", "50x40x500", "100x100x1000")
+
+# What a headless tool does on startup, timed inside a fresh interpreter
+COLD_START = """\
+import sys, time
+start = time.perf_counter()
+from frog_sim import Simulation
+from frog_variants import variant_config
+Simulation(variant_config({variant!r}), 0).step()
+print(time.perf_counter() - start, *(name for name in ("tkinter", "numpy") if name in sys.modules))
+"""
+
+
+def point_config(variant, rows, logs_per_row, balls, vectorized):
+    """The variant's config resized to a point, with balls spawning every tick."""
+    defaults = GameConfig()
+    return variant_config(
+        variant, num_rows=rows, num_logs_per_row=logs_per_row, max_balls=balls,
+        window_width=max(defaults.window_width, 2 * logs_per_row * defaults.log_width),
+        window_height=max(defaults.window_height, (rows + 2) * defaults.jump_distance),
+        ball_spawn_chance=1.0, ball_spawn_interval=1, vectorized_logs=vectorized,
+    )
+
+
+def new_game(cfg, seed):
+    """A fresh game with its ball pool already in play."""
+    sim = Simulation(cfg, seed)
+    while sim.free_balls:
+        sim.spawn_rule()  # Ball slots only exist when there is a spawn rule
+    return sim
+
+
+def run_point(point):
+    """Benchmark one point; runs in its own worker process."""
+    cfg = point_config(point["variant"], point["rows"], point["logs_per_row"], point["balls"], point["vectorized"])
+    seed = 0
+    sim = new_game(cfg, seed)
+    rng = random.Random(seed)
+
+    def next_inputs():
+        """Start the next game if this one ended, then pick this tick's inputs."""
+        nonlocal sim, seed
+        if sim.outcome is not None:
+            seed += 1
+            sim = new_game(cfg, seed)
+        return hopper_policy(sim, rng)
+
+    for _ in range(point["warmup"]):
+        sim.step(next_inputs())
+
+    # Speed: only the steps are timed
+    ticks = 0
+    balls = 0
+    elapsed = 0.0
+    clock = time.perf_counter
+    while elapsed < point["seconds"] or ticks < 10:
+        inputs = next_inputs()
+        start = clock()
+        sim.step(inputs)
+        elapsed += clock() - start
+        ticks += 1
+        balls += len(sim.balls)
+
+    # Memory: a shorter pass under tracemalloc, which slows everything down
+    transient = 0
+    blocks = 0
+    tracemalloc.start()
+    for _ in range(point["alloc_ticks"]):
+        inputs = next_inputs()  # May start a new game, which must not count
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        live = sys.getallocatedblocks()
+        sim.step(inputs)
+        blocks += sys.getallocatedblocks() - live
+        transient += tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+
+    peak_rss_kb = None
+    if resource is not None:
+        peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            peak_rss_kb //= 1024  # Reported in bytes there
+    return {
+        **point,
+        "entities": point["rows"] * point["logs_per_row"] + 2 + point["balls"],
+        "ticks": ticks,
+        "mean_balls": balls / ticks,
+        "ticks_per_sec": ticks / elapsed,
+        "alloc_bytes_per_tick": transient / point["alloc_ticks"],
+        "live_blocks_per_tick": blocks / point["alloc_ticks"],
+        "peak_rss_kb": peak_rss_kb,
+    }
+
+
+def cold_start(variant, runs):
+    """Median cold start of a headless game, over runs fresh interpreters."""
+    code = COLD_START.format(variant=variant)
+    here = os.path.dirname(os.path.abspath(__file__))
+    inside = []
+    process = []
+    bare = []
+    clock = time.perf_counter
+    for _ in range(runs):
+        start = clock()
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+        bare.append(clock() - start)
+        start = clock()
+        out = subprocess.run([sys.executable, "-c", code], cwd=here, check=True,
+                             capture_output=True, text=True).stdout.split()
+        process.append(clock() - start)
+        inside.append(float(out[0]))
+    return {
+        "variant": variant,
+        "runs": runs,
+        "import_ms": statistics.median(inside) * 1000,  # Imports and first tick
+        "process_ms": statistics.median(process) * 1000,  # The whole python -c run
+        "interpreter_ms": statistics.median(bare) * 1000,  # python -c pass, for reference
+        "heavy_imports": out[1:],
+    }
+
+
+def parse_size(text):
+    try:
+        rows, logs_per_row, balls = (int(part) for part in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected ROWSxLOGSxBALLS, got {text!r}") from None
+    return rows, logs_per_row, balls
+
+
+def point_key(point):
+    return (point["variant"], point["rows"], point["logs_per_row"], point["balls"], point["vectorized"])
+
+
+def compare(baseline, results, tolerance):
+    """Lines describing every point that regressed against the baseline."""
+    before = {point_key(point): point for point in baseline["points"]}
+    regressions = []
+    for point in results["points"]:
+        old = before.get(point_key(point))
+        if old is None:
+            continue
+        name = format_point(point)
+        if point["ticks_per_sec"] < old["ticks_per_sec"] * (1 - tolerance):
+            regressions.append(f"{name}: {point['ticks_per_sec']:.0f} ticks/s, was {old['ticks_per_sec']:.0f}")
+        # Small absolute slack so a few stray bytes on an allocation-free tick do not count
+        if point["alloc_bytes_per_tick"] > old["alloc_bytes_per_tick"] * (1 + tolerance) + 64:
+            regressions.append(f"{name}: {point['alloc_bytes_per_tick']:.0f} B/tick allocated, "
+                               f"was {old['alloc_bytes_per_tick']:.0f}")
+    new, old = results.get("cold_start"), baseline.get("cold_start")
+    if new and old:
+        # Process startup is noisy at the millisecond scale, hence the slack
+        if new["import_ms"] > old["import_ms"] * (1 + tolerance) + 2:
+            regressions.append(f"cold start: {new['import_ms']:.1f} ms, was {old['import_ms']:.1f}")
+        for name in set(new["heavy_imports"]) - set(old["heavy_imports"]):
+            regressions.append(f"cold start: now imports {name}")
+    return regressions
+
+
+def format_point(point):
+    vectorized = " numpy" if point["vectorized"] else ""
+    return f"{point['variant']} {point['rows']}x{point['logs_per_row']}x{point['balls']}{vectorized}"
+
+
+def format_result(point):
+    rss = "-" if point["peak_rss_kb"] is None else f"{point['peak_rss_kb'] / 1024:.0f} MB"
+    return (f"{format_point(point):<36} {point['entities']:>6} entities  {point['ticks_per_sec']:>9.0f} ticks/s  "
+            f"{point['alloc_bytes_per_tick']:>8.0f} B/tick  {point['live_blocks_per_tick']:>6.2f} blocks/tick  "
+            f"peak RSS {rss}")
+
+
+def format_cold_start(stats):
+    heavy = ", ".join(stats["heavy_imports"]) or "nothing heavy"
+    return (f"cold start ({stats['variant']}): {stats['import_ms']:.1f} ms to import and tick, "
+            f"{stats['process_ms']:.1f} ms per process ({stats['interpreter_ms']:.1f} ms bare python), "
+            f"imports {heavy}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the headless tick logic at growing entity counts.")
+    parser.add_argument("--variant", action="append", choices=sorted(VARIANTS),
+                        help="variant to run; repeat for several (default: all)")
+    parser.add_argument("--size", action="append", type=parse_size, metavar="ROWSxLOGSxBALLS",
+                        help=f"point to run; repeat for several (default: {' '.join(SIZES)})")
+    parser.add_argument("--vectorized", action="store_true", help="move the logs with NumPy")
+    parser.add_argument("--seconds", type=float, default=1.0, help="timed stepping per point")
+    parser.add_argument("--warmup", type=int, default=20, help="untimed ticks before measuring")
+    parser.add_argument("--alloc-ticks", type=int, default=50, help="ticks traced for the allocation numbers")
+    parser.add_argument("--cold-start-runs", type=int, default=20, help="fresh interpreters timed, 0 to skip")
+    parser.add_argument("--results", default="bench_results.json")
+    parser.add_argument("--no-run", action="store_true", help="only compare an existing --results file")
+    parser.add_argument("--compare", metavar="BASELINE", help="results file to check for regressions against")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="allowed slowdown or allocation growth")
+    args = parser.parse_args()
+
+    if args.no_run:
+        if not args.compare:
+            parser.error("--no-run needs --compare")
+        with open(args.results) as saved:
+            results = json.load(saved)
+    else:
+        # experimet plays exactly like game, so it is only run when asked for
+        variants = args.variant or sorted(name for name in VARIANTS if name != "experimet")
+        sizes = args.size or [parse_size(size) for size in SIZES]
+        points = [{"variant": variant, "rows": rows, "logs_per_row": logs_per_row, "balls": balls,
+                   "vectorized": args.vectorized, "seconds": args.seconds, "warmup": args.warmup,
+                   "alloc_ticks": args.alloc_ticks}
+                  for variant in variants for rows, logs_per_row, balls in sizes]
+        results = {"python": platform.python_version(), "platform": platform.platform(), "points": []}
+        with multiprocessing.Pool(1, maxtasksperchild=1) as pool:
+            for point in pool.imap(run_point, points):
+                results["points"].append(point)
+                print(format_result(point), flush=True)
+        if args.cold_start_runs:
+            results["cold_start"] = cold_start(args.variant[0] if args.variant else "game", args.cold_start_runs)
+            print(format_cold_start(results["cold_start"]))
+        with open(args.results, "w") as out:
+            json.dump(results, out, indent=2)
+
+    if args.compare:
+        with open(args.compare) as saved:
+            baseline = json.load(saved)
+        regressions = compare(baseline, results, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against {args.compare}:")
+            for line in regressions:
+                print("  " + line)
+            sys.exit(1)
+        print(f"\nNo regressions against {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+"""Planning bot: time-expanded A* over predicted log positions.
+
+Planner searches states (row, knight x, tick) of a knight standing on a
+log. From each state it tries waiting, a step left or right, a jump up a
+row and, in the "next_row" fall mode, a drop to the row below, and keeps
+only the moves after which the knight stands on a log again. Where the
+logs will be at any tick is predicted a tick at a time with the rules of
+move_logs and handle_log_collisions, starting from the logs as they are,
+so logs hitting each other are foreseen too. It first plans to the
+chest, then to the top of the screen (in endless mode, to the top row,
+again and again as the world scrolls).
+
+A plan is followed for as long as the game matches what it predicted;
+it is only replanned once the chest moves, the world scrolls or the
+knight ends up somewhere unexpected. Predicted log positions are memoised
+per tick and kept across replans while they still match the game; that
+is the only thing carried over, and which states are reachable is worked
+out afresh by every search, since a replan usually means a new goal. Every
+search stops after a fixed number of expanded states or once its time
+limit is up, whichever comes first, taking the path to the most promising
+state found so far that still has a safe move, so a decision stays under
+a millisecond. With the time limit the moves depend on how fast the
+machine is; --time-limit-us 0 turns it off for reproducible runs.
+
+Falling balls are ignored: they only cost points. Variants where the
+knight rides a fixed log, launches off it or bounces (play_play_lol,
+import_tkinter_as_tk) move in ways the model does not follow and are
+refused.
+
+Examples:
+    python frog_bot.py --variant game --games 100
+    python frog_bot.py --variant quantumquest --chests 3
+"""
+import argparse
+import heapq
+import math
+import time
+import weakref
+
+from frog_profile import PhaseStats
+from frog_sim import DOWN, JUMP, LEFT, RIGHT, WIN, Simulation
+from frog_variants import VARIANTS, variant_config
+
+BUDGET = 80  # States expanded per search at most
+TIME_LIMIT_NS = 800_000  # Time a replan may take before the search stops early
+HORIZON = 120  # Ticks ahead a plan may reach
+MARGIN = 0.5  # Pixels of log the knight must keep under it to count as safe
+CATCH_UP = 8  # Ticks a row's memo may lag behind the game before it is seeded afresh
+WEIGHT = 2  # Weight of the estimate: trades shortest paths for far fewer expanded states
+
+WAIT = None  # Action of a tick with no key pressed
+
+
+class Planner:
+    """Plans and follows key presses for one Simulation."""
+
+    def __init__(self, sim, chests=1, budget=BUDGET, horizon=HORIZON, time_limit_ns=TIME_LIMIT_NS):
+        cfg = sim.config
+        if cfg.jump_mode != "move" or cfg.anchor_knight or cfg.bounce_velocity is not None:
+            raise ValueError("The planner needs jumps that move the knight straight up a row "
+                             "and landings that stop it")
+        self.sim = sim
+        self.chests = chests  # Chests to collect before heading for the exit
+        self.budget = budget
+        self.time_limit_ns = time_limit_ns  # None or 0 for no limit
+        self.horizon = horizon
+        self.actions = [WAIT, LEFT, RIGHT, JUMP] + ([DOWN] if cfg.fall_mode == "next_row" else [])
+        self.plan = []  # (action, tick, row, x) still to play, next one last
+        self.expected = None  # (tick, row, x) the last planned action should have led to
+        self.planned_for = None  # Chest count and scroll the plan was made for
+        self.logs = {}  # (tick, row) -> [(x1, x2, knight carry, speed) per log]
+        self.searches = 0
+
+    def decide(self):
+        """The inputs for the next tick."""
+        sim = self.sim
+        cfg = sim.config
+        if sim.outcome is not None:
+            return ()
+        rects = sim.rects
+        k = 4 * sim.knight
+        row = sim.get_knight_row()
+        # Standing on a row, possibly sunk into its logs after a fall
+        if sim.falling or sim.velocity_y or not 0 <= rects[k + 3] - cfg.row_y(row) <= cfg.log_height:
+            # In the air: above the top row after a jump, jump again once that wins
+            if rects[k + 1] - cfg.jump_distance <= 0:
+                return (JUMP,)
+            return ()
+        x = rects[k]
+
+        situation = (sim.chests_collected, sim.rows_climbed)
+        expected = self.expected
+        if (not self.plan or situation != self.planned_for or expected[0] != sim.tick
+                or expected[1] != row or abs(expected[2] - x) > 1e-6):
+            self.replan(row, x, situation)
+        if not self.plan:
+            return ()
+        action, tick, row, x = self.plan.pop()
+        self.expected = (tick, row, x)
+        return () if action is WAIT else (action,)
+
+    def replan(self, row, x, situation):
+        sim = self.sim
+        deadline = math.inf
+        if self.time_limit_ns:
+            deadline = time.perf_counter_ns() + self.time_limit_ns
+        self.searches += 1
+        self.planned_for = situation
+        if self.predicted():
+            for key in [key for key in self.logs if key[0] < sim.tick]:
+                del self.logs[key]
+        else:
+            self.seed_logs()
+        self.plan = self.search(row, x, sim.tick, sim.chests_collected < self.chests, deadline)
+        self.plan.reverse()
+
+    def predicted(self):
+        """Whether the memoised logs hold the game's logs as they are now.
+
+        A row the last search left far behind would take longer to step up
+        to now than seeding the memo again, so that counts as a miss too.
+        """
+        sim = self.sim
+        rects = sim.rects
+        speeds = sim.log_speeds
+        per_row = sim.config.num_logs_per_row
+        logs = self.logs
+        for row in range(sim.config.num_rows):
+            known = sim.tick
+            while (known, row) not in logs:
+                known -= 1
+                if known < sim.tick - CATCH_UP:
+                    return False
+            slot = row * per_row
+            for x1, _, _, speed in self.logs_at(sim.tick, row):
+                if x1 != rects[4 * slot] or speed != speeds[slot]:
+                    return False
+                slot += 1
+        return True
+
+    def seed_logs(self):
+        """Start the memo afresh from the logs as they are now."""
+        sim = self.sim
+        cfg = sim.config
+        rects = sim.rects
+        self.logs.clear()
+        for row in range(cfg.num_rows):
+            logs = []
+            for slot in range(row * cfg.num_logs_per_row, (row + 1) * cfg.num_logs_per_row):
+                speed = sim.log_speeds[slot]
+                logs.append((rects[4 * slot], rects[4 * slot + 2], speed * cfg.carry_factor, speed))
+            self.logs[(sim.tick, row)] = logs
+
+    def logs_at(self, tick, row):
+        """(x1, x2, knight carry, speed) of the logs of a row after the given tick.
+
+        Predicted a tick at a time with the rules of Simulation.move_logs and
+        handle_log_collisions, so unlike log_state it foresees logs hitting
+        each other, and memoised until the logs stop matching the prediction.
+        """
+        logs = self.logs.get((tick, row))
+        if logs is not None:
+            return logs
+        cfg = self.sim.config
+        width = cfg.window_width
+        moved = []
+        for x1, x2, _, speed in self.logs_at(tick - 1, row):
+            x1 += speed
+            x2 += speed
+            moved.append([x1, x2, -speed if x2 >= width or x1 <= 0 else speed])
+        if cfg.log_collisions:
+            # Every overlapping pair turns both logs round
+            ordered = sorted(moved)
+            for i, a in enumerate(ordered):
+                for b in ordered[i + 1:]:
+                    if b[0] > a[1]:
+                        break
+                    a[2] = -a[2]
+                    b[2] = -b[2]
+        carry = cfg.carry_factor
+        logs = self.logs[(tick, row)] = [(x1, x2, speed * carry, speed) for x1, x2, speed in moved]
+        return logs
+
+    def search(self, row, x, tick, chest, deadline=math.inf):
+        """Actions to the goal, or towards the most promising state found.
+
+        Stops after self.budget expanded states, or once perf_counter_ns()
+        passes the deadline.
+
+        Returns a list of (action, tick, row, x): each action and the state
+        it leads to after that tick.
+        """
+        sim = self.sim
+        cfg = sim.config
+        endless = cfg.endless
+        kw, kh, jump, move_step = cfg.knight_width, cfg.knight_height, cfg.jump_distance, cfg.move_step
+        rows = cfg.num_rows
+        top_row = rows - 1
+        # Knight top y when standing on each row; a jump that takes it to 0 or above wins
+        tops = [cfg.row_y(row) - kh for row in range(rows + 1)]
+
+        if chest:
+            c = 4 * sim.chest
+            cx1, cy1, cx2, cy2 = sim.rects[c:c + 4]
+            # Rows where the standing knight touches the chest
+            targets = [row for row in range(rows) if not (tops[row] + kh < cy1 or tops[row] > cy2)]
+            chest = bool(targets)
+        # Lower bound of the ticks still needed from each row, sideways moves aside
+        if chest:
+            row_cost = [max(min(abs(row - target) for target in targets), 1) for row in range(rows + 1)]
+        elif endless:
+            row_cost = [top_row - row for row in range(rows + 1)]
+        else:
+            row_cost = [max(math.ceil(top / jump), 1) for top in tops]
+        # Fastest the knight can travel sideways in a tick
+        reach = move_step + abs(cfg.carry_factor) * max(map(abs, sim.log_speeds), default=0) + 1e-9
+        # Knight top after a jump from the top row and a tick of falling, for the winning double jump
+        air_top = tops[rows] + min(cfg.gravity, math.inf if cfg.max_fall_velocity is None else cfg.max_fall_velocity)
+
+        def estimate(row, x):
+            if chest:
+                dx = max(cx1 - x - kw, x - cx2, 0)
+                return max(row_cost[row], math.ceil(dx / reach))
+            return row_cost[row]
+
+        start = tick
+        horizon = start + self.horizon
+        logs_at = self.logs_at
+        nodes = [(None, WAIT, tick, row, x)]  # (parent, action, tick, row, x)
+        frontier = [(WEIGHT * estimate(row, x), 0, 0)]  # (f, -ticks, node)
+        seen = {(tick, row, round(x))}
+        # (estimate, -tick, node) of the most promising state that is no dead end
+        best = (estimate(row, x), -tick, 0)
+        goal = None
+        expanded = 0
+        clock = time.perf_counter_ns
+        while frontier and goal is None and expanded < self.budget and clock() < deadline:
+            _, _, index = heapq.heappop(frontier)
+            _, _, tick, row, x = nodes[index]
+            expanded += 1
+            if tick >= horizon:
+                continue
+            after = tick + 1
+            alive = False
+            for action in self.actions:
+                new_row, new_x = row, x
+                if action == LEFT:
+                    new_x = x - move_step
+                elif action == RIGHT:
+                    new_x = x + move_step
+                elif action == JUMP:
+                    new_row = row + 1
+                    if new_row > top_row and not endless:
+                        if chest:
+                            continue
+                        if tops[new_row] <= 0:
+                            goal = (index, action, after, new_row, new_x)
+                            break
+                        if air_top - jump <= 0:
+                            # Nothing to land on up there, but the next jump wins
+                            nodes.append((index, action, after, new_row, new_x))
+                            goal = (len(nodes) - 1, JUMP, after + 1, new_row + 1, new_x)
+                            break
+                        continue  # Falls back down; a drop may still be worth trying
+                elif action == DOWN:
+                    # Drops only onto a log of the row below that is under the knight now
+                    if row == 0 or not any(x1 <= x + kw and x2 >= x for x1, x2, _, _ in logs_at(tick, row - 1)):
+                        continue
+                    new_row = row - 1
+                if new_row > top_row:
+                    continue
+
+                # The knight rides the first log it touches, as in check_knight_on_log
+                new_x2 = new_x + kw
+                for x1, x2, carry, _ in logs_at(after, new_row):
+                    if new_x2 >= x1 and new_x <= x2:
+                        break
+                else:
+                    continue  # Nothing under it
+                if new_x2 < x1 + MARGIN or new_x > x2 - MARGIN:
+                    continue  # Hanging off the edge
+                alive = True
+                landed = new_x + carry
+                key = (after, new_row, round(landed))
+                if key in seen:
+                    continue
+                seen.add(key)
+                nodes.append((index, action, after, new_row, landed))
+                node = len(nodes) - 1
+                if chest:
+                    # Collected by a move that ends touching it
+                    if (action is not WAIT and action != DOWN and new_row in targets
+                            and not (new_x2 < cx1 or new_x > cx2)):
+                        goal = (node, None, None, None, None)
+                        break
+                elif endless and new_row == top_row:
+                    goal = (node, None, None, None, None)
+                    break
+                heapq.heappush(frontier, (after - start + WEIGHT * estimate(new_row, landed), -after, node))
+            if alive and index:
+                h = estimate(row, x)
+                if (h, -tick) < best[:2]:
+                    best = (h, -tick, index)
+
+        path = []
+        if goal is not None:
+            index, action, tick, row, x = goal
+            if action is not None:
+                path.append((action, tick, row, x))  # The winning jump
+        else:
+            index = best[2]
+            if not index and frontier and expanded < self.budget:
+                # Out of time before any move proved itself: take the most promising open state
+                index = frontier[0][2]
+        while index:
+            parent, action, tick, row, x = nodes[index]
+            path.append((action, tick, row, x))
+            index = parent
+        path.reverse()
+        return path
+
+
+# One planner per game being played through planner_policy
+planners = weakref.WeakKeyDictionary()
+
+
+def planner_policy(sim, rng):
+    """Play with a Planner: collect one chest, then head for the exit."""
+    planner = planners.get(sim)
+    if planner is None:
+        # No time limit: seeded tuning runs must play the same way on any machine
+        planner = planners[sim] = Planner(sim, time_limit_ns=None)
+    return planner.decide()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play seeded Frog Jump games with the planning bot.")
+    parser.add_argument("--variant", default="game", choices=sorted(VARIANTS))
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chests", type=int, default=1, help="chests to collect before the exit")
+    parser.add_argument("--max-ticks", type=int, default=3000, help="ticks before a game counts as unfinished")
+    parser.add_argument("--budget", type=int, default=BUDGET, help="states expanded per search")
+    parser.add_argument("--time-limit-us", type=int, default=TIME_LIMIT_NS // 1000,
+                        help="time a replan may take, 0 for none (moves then no longer depend on speed)")
+    args = parser.parse_args()
+
+    try:
+        Planner(Simulation(variant_config(args.variant), args.seed))
+    except ValueError as error:
+        parser.error(f"{args.variant}: {error}")
+
+    decisions = PhaseStats()
+    total_ns = 0
+    wins = chests = ticks = searches = 0
+    for seed in range(args.seed, args.seed + args.games):
+        sim = Simulation(variant_config(args.variant), seed)
+        planner = Planner(sim, args.chests, args.budget, time_limit_ns=args.time_limit_us * 1000)
+        while sim.outcome is None and sim.tick < args.max_ticks:
+            start = time.perf_counter_ns()
+            inputs = planner.decide()
+            elapsed = time.perf_counter_ns() - start
+            decisions.add(elapsed)
+            total_ns += elapsed
+            sim.step(inputs)
+        wins += sim.outcome == WIN
+        chests += sim.chests_collected
+        ticks += sim.tick
+        searches += planner.searches
+    p50, p99 = decisions.percentiles(50, 99)
+    print(f"{args.variant}: {wins}/{args.games} won, {chests / args.games:.2f} chests and "
+          f"{ticks / args.games:.0f} ticks per game, a search every {ticks / max(searches, 1):.1f} ticks")
+    print(f"decision time: mean {total_ns / max(decisions.count, 1) / 1000:.1f} us, p50 {p50 / 1000:.1f} us, "
+          f"p99 {p99 / 1000:.1f} us, max {decisions.max_ns / 1000:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
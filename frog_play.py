@@ -0,0 +1,49 @@
+"""Play any Frog Jump variant in a Tk window.
+
+Picks the variant by name and turns on the optional input recording,
+event trace and phase profile that FrogJumpGame can save on exit.
+tkinter and frog_tk are only imported once a window is asked for, so
+headless tools can import this module and the simulation without a
+display. The repository directory runs this too, through __main__.py.
+
+Examples:
+    python frog_play.py quantumquest
+    python frog_play.py endless --record run.fjr --trace trace.bin --profile profile.json
+    python . gravity_quest --seed 7
+    python frog_play.py --list
+"""
+import argparse
+
+from frog_variants import VARIANTS, variant_config
+
+
+def play(config=None, seed=None, record_to=None, trace_to=None, profile_to=None):
+    """Open a window playing the config until it is closed."""
+    import tkinter as tk
+
+    from frog_tk import FrogJumpGame
+
+    root = tk.Tk()
+    game = FrogJumpGame(root, config, seed, record_to, trace_to, profile_to)
+    root.mainloop()
+    return game
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play a Frog Jump variant.")
+    parser.add_argument("variant", nargs="?", default="game", choices=sorted(VARIANTS))
+    parser.add_argument("--seed", type=int, help="RNG seed (default: random)")
+    parser.add_argument("--record", metavar="FILE", help="save the key presses for frog_replay.py")
+    parser.add_argument("--trace", metavar="FILE", help="save the event trace for frog_trace.py")
+    parser.add_argument("--profile", metavar="FILE", help="save per-phase frame times as JSON")
+    parser.add_argument("--list", action="store_true", help="print the variant names and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(sorted(VARIANTS)))
+        return
+    play(variant_config(args.variant), args.seed, args.record, args.trace, args.profile)
+
+
+if __name__ == "__main__":
+    main()
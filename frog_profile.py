@@ -0,0 +1,77 @@
+"""Per-phase frame-time profiler.
+
+PhaseProfiler collects perf_counter_ns durations per named phase. Each
+phase keeps a rolling window of recent samples for live percentiles (the
+HUD in frog_tk.py shows them) and a cumulative power-of-two histogram that
+export() writes out as JSON when the game exits.
+"""
+import json
+from array import array
+
+WINDOW = 512  # Recent samples kept per phase for the rolling percentiles
+BUCKETS = 40  # Histogram bucket b counts durations below 2**b ns
+
+
+class PhaseStats:
+    """Rolling window and histogram for one phase."""
+
+    def __init__(self):
+        self.samples = array("q", bytes(8 * WINDOW))
+        self.head = 0
+        self.count = 0
+        self.buckets = [0] * BUCKETS
+        self.max_ns = 0
+
+    def add(self, ns):
+        self.samples[self.head] = ns
+        self.head = (self.head + 1) % WINDOW
+        self.count += 1
+        self.buckets[min(ns.bit_length(), BUCKETS - 1)] += 1
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def percentiles(self, *points):
+        """Percentiles over the rolling window, in nanoseconds."""
+        held = sorted(self.samples[:min(self.count, WINDOW)])
+        if not held:
+            return [0] * len(points)
+        return [held[min(int(len(held) * point / 100), len(held) - 1)] for point in points]
+
+
+class PhaseProfiler:
+    """Durations per named phase ("sim.logs", "render.balls", ...)."""
+
+    def __init__(self):
+        self.phases = {}
+
+    def add(self, phase, ns):
+        stats = self.phases.get(phase)
+        if stats is None:
+            stats = self.phases[phase] = PhaseStats()
+        stats.add(ns)
+
+    def report_lines(self):
+        """One line per phase with the rolling p50/p95/p99 in microseconds."""
+        lines = [f"{'phase':<16}{'p50':>8}{'p95':>8}{'p99':>8}  us"]
+        for phase, stats in list(self.phases.items()):  # Phases may be added from another thread
+            p50, p95, p99 = stats.percentiles(50, 95, 99)
+            lines.append(f"{phase:<16}{p50 / 1000:>8.1f}{p95 / 1000:>8.1f}{p99 / 1000:>8.1f}")
+        return lines
+
+    def export(self, path):
+        """Write every phase's percentiles and histogram to a JSON file."""
+        report = {}
+        for phase, stats in list(self.phases.items()):
+            p50, p95, p99 = stats.percentiles(50, 95, 99)
+            report[phase] = {
+                "samples": stats.count,
+                "p50_us": p50 / 1000,
+                "p95_us": p95 / 1000,
+                "p99_us": p99 / 1000,
+                "max_us": stats.max_ns / 1000,
+                # Upper bound of each bucket in microseconds -> samples below it
+                "histogram": {f"{2 ** bucket / 1000:g}": count
+                              for bucket, count in enumerate(stats.buckets) if count},
+            }
+        with open(path, "w") as out:
+            json.dump(report, out, indent=2)
@@ -0,0 +1,243 @@
+"""Offscreen NumPy renderer for Frog Jump games.
+
+FrameRenderer rasterises a Simulation into a preallocated RGB framebuffer
+without Tk or a display: logs, knight and chest as outlined rectangles,
+balls as outlined ovals, and the score and outcome messages in a small
+built-in bitmap font. Only the regions that changed since the last frame
+are cleared and redrawn. Each frame is exposed as a memoryview over the
+framebuffer itself, so nothing is copied; copy it if you need to keep it
+past the next render().
+
+Meant for replay thumbnails and training observations rendered in bulk
+on headless machines. As a script it writes thumbnails of a recording:
+    python frog_raster.py run.fjr thumbs/ --every 50 --scale 0.25
+"""
+import argparse
+import os
+
+import numpy as np
+
+from frog_replay import Recording, replay_ticks
+from frog_sim import WIN
+
+BACKGROUND = (250, 240, 230)  # #faf0e6, as on the Tk canvas
+OUTLINE = (0, 0, 0)
+# The Tk colour names the game uses
+COLORS = {
+    "black": (0, 0, 0), "red": (255, 0, 0), "green": (0, 255, 0), "blue": (0, 0, 255),
+    "brown": (165, 42, 42), "gray": (190, 190, 190), "yellow": (255, 255, 0),
+}
+
+# 3x5 glyphs, rows top to bottom separated by "/"
+GLYPHS = {
+    "A": ".#./#.#/###/#.#/#.#", "B": "##./#.#/##./#.#/##.", "C": ".##/#../#../#../.##",
+    "D": "##./#.#/#.#/#.#/##.", "E": "###/#../##./#../###", "F": "###/#../##./#../#..",
+    "G": ".##/#../#.#/#.#/.##", "H": "#.#/#.#/###/#.#/#.#", "I": "###/.#./.#./.#./###",
+    "J": "..#/..#/..#/#.#/.#.", "K": "#.#/#.#/##./#.#/#.#", "L": "#../#../#../#../###",
+    "M": "#.#/###/###/#.#/#.#", "N": "##./#.#/#.#/#.#/#.#", "O": ".#./#.#/#.#/#.#/.#.",
+    "P": "##./#.#/##./#../#..", "Q": ".#./#.#/#.#/##./.##", "R": "##./#.#/##./#.#/#.#",
+    "S": ".##/#../.#./..#/##.", "T": "###/.#./.#./.#./.#.", "U": "#.#/#.#/#.#/#.#/###",
+    "V": "#.#/#.#/#.#/#.#/.#.", "W": "#.#/#.#/###/###/#.#", "X": "#.#/#.#/.#./#.#/#.#",
+    "Y": "#.#/#.#/.#./.#./.#.", "Z": "###/..#/.#./#../###",
+    "0": "###/#.#/#.#/#.#/###", "1": ".#./##./.#./.#./###", "2": "##./..#/.#./#../###",
+    "3": "##./..#/.#./..#/##.", "4": "#.#/#.#/###/..#/..#", "5": "###/#../##./..#/##.",
+    "6": ".##/#../###/#.#/###", "7": "###/..#/.#./.#./.#.", "8": "###/#.#/###/#.#/###",
+    "9": "###/#.#/###/..#/##.", "-": ".../.../###/.../...", ":": ".../.#./.../.#./...",
+    "!": ".#./.#./.#./.../.#.", " ": ".../.../.../.../...",
+}
+
+
+def text_mask(text, size):
+    """Boolean mask of text in the bitmap font, each font pixel size x size."""
+    columns = []
+    for char in text.upper():
+        rows = GLYPHS.get(char, GLYPHS[" "]).split("/")
+        columns.append(np.array([[cell == "#" for cell in row] for row in rows]))
+        columns.append(np.zeros((5, 1), dtype=bool))  # Gap between letters
+    mask = np.hstack(columns[:-1]) if columns else np.zeros((5, 0), dtype=bool)
+    return mask.repeat(size, axis=0).repeat(size, axis=1)
+
+
+def outcome_message(sim):
+    """The (text, colour) shown once a game is over, as in frog_tk."""
+    cfg = sim.config
+    if sim.outcome == WIN:
+        return "You Win!", "green"
+    if cfg.endless:
+        return f"Game Over! Climbed {sim.rows_climbed} rows", "red"
+    if cfg.show_final_score:
+        return f"Game Over! Final Score: {sim.score}", "red"
+    return "Game Over!", "red"
+
+
+class FrameRenderer:
+    """Draws a Simulation into an RGB framebuffer, redrawing only what changed."""
+
+    def __init__(self, sim, scale=1.0):
+        cfg = sim.config
+        self.scale = scale
+        self.width = max(1, round(cfg.window_width * scale))
+        self.height = max(1, round(cfg.window_height * scale))
+        self.pixels = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        self.frame = memoryview(self.pixels)  # Zero-copy view handed out by render()
+        self.reset(sim)
+
+    def reset(self, sim):
+        """Start drawing another game (same window size) from a full redraw."""
+        cfg = sim.config
+        self.sim = sim
+        slots = sim.first_ball + cfg.max_balls
+        self.colors = np.empty((slots, 3), dtype=np.uint8)
+        self.colors[:sim.num_logs] = COLORS["brown"]
+        self.colors[sim.knight] = COLORS["gray"]
+        self.colors[sim.chest] = COLORS["yellow"]
+        self.colors[sim.first_ball:] = COLORS[cfg.ball_color]
+        self.boxes = np.zeros((slots, 4), dtype=np.int64)
+        self.visible = np.zeros(slots, dtype=bool)
+        self.texts = {}  # Name -> (text, colour, box, mask)
+        self.pixels[:] = BACKGROUND
+        self.render()
+
+    def pixel_boxes(self):
+        """Pixel boxes [x0, y0, x1, y1) of every slot, clipped to the frame."""
+        rects = np.frombuffer(self.sim.rects, dtype=np.float64).reshape(-1, 4) * self.scale
+        boxes = np.floor(rects).astype(np.int64)
+        boxes[:, 2:] += 1  # Tk draws x2 and y2 inclusive
+        np.clip(boxes[:, 0::2], 0, self.width, out=boxes[:, 0::2])
+        np.clip(boxes[:, 1::2], 0, self.height, out=boxes[:, 1::2])
+        return boxes
+
+    def current_texts(self):
+        """Name -> (text, colour, font size, centre) of the text to show."""
+        sim = self.sim
+        cfg = sim.config
+        scale = self.scale
+        texts = {"score": (f"Score: {sim.score}", "black", max(1, int(3 * scale)),
+                           ((cfg.window_width - 50) * scale, 20 * scale))}
+        if sim.outcome is not None:
+            text, color = outcome_message(sim)
+            texts["outcome"] = (text, color, max(1, int(5 * scale)),
+                                (cfg.window_width / 2 * scale, cfg.window_height / 2 * scale))
+        return texts
+
+    def render(self):
+        """Bring the framebuffer up to date and return it as a memoryview."""
+        sim = self.sim
+        dirty = []
+
+        boxes = self.pixel_boxes()
+        visible = np.zeros(len(boxes), dtype=bool)
+        visible[:sim.first_ball] = True
+        visible[sim.balls] = True
+        moved = (boxes != self.boxes).any(axis=1)
+        changed = (visible != self.visible) | (visible & moved)
+        dirty.extend(self.boxes[changed & self.visible])
+        dirty.extend(boxes[changed & visible])
+        self.boxes = boxes
+        self.visible = visible
+
+        texts = {}
+        for name, (text, color, size, (cx, cy)) in self.current_texts().items():
+            old = self.texts.get(name)
+            if old is not None and old[0] == text:
+                texts[name] = old
+                continue
+            mask = text_mask(text, size)
+            x0 = int(cx - mask.shape[1] / 2)
+            y0 = int(cy - mask.shape[0] / 2)
+            box = np.array([x0, y0, x0 + mask.shape[1], y0 + mask.shape[0]])
+            texts[name] = (text, color, box, mask)
+            dirty.append(box)
+            if old is not None:
+                dirty.append(old[2])
+        for name, old in self.texts.items():
+            if name not in texts:
+                dirty.append(old[2])
+        self.texts = texts
+
+        for box in dirty:
+            self.redraw(*(int(value) for value in box))
+        return self.frame
+
+    def redraw(self, x0, y0, x1, y1):
+        """Clear a region and draw everything that overlaps it, back to front."""
+        x0, y0 = max(x0, 0), max(y0, 0)
+        x1, y1 = min(x1, self.width), min(y1, self.height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        self.pixels[y0:y1, x0:x1] = BACKGROUND
+        boxes = self.boxes
+        hits = np.flatnonzero(self.visible & (boxes[:, 0] < x1) & (boxes[:, 2] > x0)
+                              & (boxes[:, 1] < y1) & (boxes[:, 3] > y0))
+        first_ball = self.sim.first_ball
+        # Slots are numbered in the Tk stacking order: logs, knight, chest, balls
+        for slot in hits:
+            if slot < first_ball:
+                self.draw_rectangle(boxes[slot], self.colors[slot], x0, y0, x1, y1)
+            else:
+                self.draw_oval(boxes[slot], self.colors[slot], x0, y0, x1, y1)
+        for text, color, box, mask in self.texts.values():
+            self.draw_mask(box, mask, COLORS[color], x0, y0, x1, y1)
+
+    def draw_rectangle(self, box, color, x0, y0, x1, y1):
+        """An outlined rectangle, clipped to the region."""
+        bx0, by0, bx1, by1 = box
+        self.pixels[max(by0, y0):min(by1, y1), max(bx0, x0):min(bx1, x1)] = OUTLINE
+        self.pixels[max(by0 + 1, y0):min(by1 - 1, y1), max(bx0 + 1, x0):min(bx1 - 1, x1)] = color
+
+    def draw_oval(self, box, color, x0, y0, x1, y1):
+        """An outlined oval filling box, clipped to the region."""
+        bx0, by0, bx1, by1 = box
+        cx0, cy0, cx1, cy1 = max(bx0, x0), max(by0, y0), min(bx1, x1), min(by1, y1)
+        if cx0 >= cx1 or cy0 >= cy1:
+            return
+        rx = (bx1 - bx0) / 2
+        ry = (by1 - by0) / 2
+        xs = (np.arange(cx0, cx1) + 0.5 - (bx0 + rx))[None, :]
+        ys = (np.arange(cy0, cy1) + 0.5 - (by0 + ry))[:, None]
+        region = self.pixels[cy0:cy1, cx0:cx1]
+        region[(xs / rx) ** 2 + (ys / ry) ** 2 <= 1] = OUTLINE
+        if rx > 1 and ry > 1:
+            region[(xs / (rx - 1)) ** 2 + (ys / (ry - 1)) ** 2 <= 1] = color
+
+    def draw_mask(self, box, mask, color, x0, y0, x1, y1):
+        """Paint the set pixels of a mask placed at box, clipped to the region."""
+        bx0, by0, bx1, by1 = (int(value) for value in box)
+        cx0, cy0, cx1, cy1 = max(bx0, x0, 0), max(by0, y0, 0), min(bx1, x1), min(by1, y1)
+        if cx0 >= cx1 or cy0 >= cy1:
+            return
+        region = self.pixels[cy0:cy1, cx0:cx1]
+        region[mask[cy0 - by0:cy1 - by0, cx0 - bx0:cx1 - bx0]] = color
+
+
+def write_ppm(path, frame, width, height):
+    """Save a frame as a binary PPM image."""
+    with open(path, "wb") as out:
+        out.write(f"P6 {width} {height} 255\n".encode())
+        out.write(frame)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render thumbnails of a Frog Jump recording.")
+    parser.add_argument("recording")
+    parser.add_argument("outdir")
+    parser.add_argument("--every", type=int, default=50, help="ticks between thumbnails")
+    parser.add_argument("--scale", type=float, default=0.25)
+    args = parser.parse_args()
+
+    os.makedirs(args.outdir, exist_ok=True)
+    renderer = None
+    written = 0
+    for sim in replay_ticks(Recording.load(args.recording)):
+        if renderer is None:
+            renderer = FrameRenderer(sim, args.scale)
+        frame = renderer.render()
+        if sim.tick % args.every == 0 or sim.outcome is not None:
+            write_ppm(os.path.join(args.outdir, f"frame_{sim.tick:06d}.ppm"), frame,
+                      renderer.width, renderer.height)
+            written += 1
+    print(f"Wrote {written} thumbnails to {args.outdir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""Deterministic input recording and headless replay.
+
+A recording holds the game settings, the RNG seed and every key press
+stamped with the tick it was applied before. Since Simulation draws all
+randomness from its seeded RNG, feeding the same presses back at the same
+ticks reproduces the run exactly.
+
+File layout (all integers are LEB128 varints):
+    b"FJR1"
+    seed
+    length + zlib-compressed JSON of the settings that differ from defaults
+    one varint per key press: (ticks since previous press << 3) | action
+    end marker: (ticks since last press << 3) | 7
+    zigzag(final score), outcome (0 playing, 1 win, 2 lose)
+
+A press usually costs one byte, so hour-long sessions stay at a few KB.
+
+Usage:
+    python frog_replay.py run.fjr
+"""
+import json
+import sys
+import time
+import zlib
+
+from frog_sim import OUTCOME_CODES, OUTCOMES, GameConfig, Simulation
+
+MAGIC = b"FJR1"
+END = 7
+
+
+def write_varint(out, value):
+    """Append a non-negative integer to a bytearray as a LEB128 varint."""
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data, pos):
+    """Read a varint at pos and return (value, position after it)."""
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def zigzag(value):
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def unzigzag(value):
+    return value >> 1 if not value & 1 else -(value >> 1) - 1
+
+
+def config_overrides(config):
+    """Settings of a config that differ from the GameConfig defaults."""
+    defaults = vars(GameConfig())
+    return {name: value for name, value in vars(config).items() if defaults[name] != value}
+
+
+class Recorder:
+    """Collect the key presses of one game as they are applied."""
+
+    def __init__(self, config, seed):
+        self.data = bytearray(MAGIC)
+        write_varint(self.data, seed)
+        settings = zlib.compress(json.dumps(config_overrides(config), sort_keys=True).encode(), 9)
+        write_varint(self.data, len(settings))
+        self.data += settings
+        self.last_tick = 0
+        self.finished = False
+
+    def record(self, tick, action):
+        """Note that action was applied before tick + 1 was simulated."""
+        write_varint(self.data, (tick - self.last_tick) << 3 | action)
+        self.last_tick = tick
+
+    def finish(self, sim):
+        """Close the recording with the final tick, score and outcome."""
+        if not self.finished:
+            write_varint(self.data, (sim.tick - self.last_tick) << 3 | END)
+            write_varint(self.data, zigzag(sim.score))
+            self.data.append(OUTCOME_CODES[sim.outcome])
+            self.finished = True
+        return bytes(self.data)
+
+    def save(self, path, sim):
+        with open(path, "wb") as out:
+            out.write(self.finish(sim))
+
+
+class Recording:
+    """A decoded recording."""
+
+    def __init__(self, data):
+        if data[:4] != MAGIC:
+            raise ValueError("Not a Frog Jump recording")
+        self.seed, pos = read_varint(data, 4)
+        size, pos = read_varint(data, pos)
+        self.config = GameConfig(**json.loads(zlib.decompress(data[pos:pos + size])))
+        pos += size
+
+        # Key presses as (tick, action) pairs
+        self.events = []
+        tick = 0
+        while True:
+            value, pos = read_varint(data, pos)
+            tick += value >> 3
+            if value & 7 == END:
+                break
+            self.events.append((tick, value & 7))
+        self.final_tick = tick
+        score, pos = read_varint(data, pos)
+        self.score = unzigzag(score)
+        self.outcome = OUTCOMES[data[pos]]
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as recording:
+            return cls(recording.read())
+
+
+def replay_ticks(recording):
+    """Re-run a recording headlessly, yielding the simulation after every tick.
+
+    The same Simulation object is yielded each time: first before any tick,
+    then after each tick, and once more if presses after the last tick
+    (e.g. the winning jump) changed it.
+    """
+    sim = Simulation(recording.config, recording.seed)
+    yield sim
+    step = sim.step
+    events = recording.events
+    index = 0
+    count = len(events)
+    while sim.tick < recording.final_tick and sim.outcome is None:
+        if index < count and events[index][0] == sim.tick:
+            inputs = []
+            while index < count and events[index][0] == sim.tick:
+                inputs.append(events[index][1])
+                index += 1
+            step(inputs)
+        else:
+            step()
+        yield sim
+    # Presses after the last tick
+    if index < count and sim.outcome is None:
+        sim.apply_inputs([action for _, action in events[index:]])
+        yield sim
+
+
+def replay(recording):
+    """Re-run a recording headlessly at full speed and return the simulation."""
+    for sim in replay_ticks(recording):
+        pass
+    return sim
+
+
+def main():
+    if len(sys.argv) != 2:
+        print("usage: python frog_replay.py RECORDING")
+        sys.exit(2)
+    recording = Recording.load(sys.argv[1])
+    start = time.perf_counter()
+    sim = replay(recording)
+    elapsed = time.perf_counter() - start
+    match = sim.score == recording.score and sim.outcome == recording.outcome and sim.tick == recording.final_tick
+    print(f"{len(recording.events)} presses over {recording.final_tick} ticks replayed in {elapsed:.3f}s")
+    print(f"score {sim.score}, outcome {sim.outcome or 'unfinished'}: "
+          f"{'matches the recording' if match else 'DIFFERS from the recording'}")
+    sys.exit(0 if match else 1)
+
+
+if __name__ == "__main__":
+    main()
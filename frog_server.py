@@ -0,0 +1,323 @@
+"""Headless Frog Jump match server on asyncio.
+
+One process hosts many matches. There is a single scheduler timer: each
+wake-up steps every match whose tick is due, then the timer is re-armed
+for the earliest next tick, so the cost of waiting does not grow with the
+number of matches. A match that fell behind runs up to max_catch_up_ticks
+at once and drops any time beyond that, like the Tk loop.
+
+Protocol (TCP):
+    client -> server  b"JOIN <variant> [seed]\\n", then one byte per key
+                      press (0 left, 1 right, 2 jump, 3 down), applied
+                      before the match's next tick. Presses are folded
+                      into a net move and jump and fall flags as they
+                      arrive, so a flood of them takes no memory.
+    server -> client  b"OK <tick_ms> <logs> <max_balls>\\n", then after every
+                      tick an update: UPDATE header, the x1 of every log as
+                      float32 (row y is fixed by the variant), and x1, y1
+                      of every ball in play as float32. Each update holds
+                      the whole state, so while a client is not reading
+                      and its send buffer is over MAX_BUFFERED, updates
+                      are skipped. The connection is closed after the
+                      update that ends the game.
+
+The server prints tick lateness (how long after its due time each match
+tick ran) and how busy the scheduler is, and from that how many matches
+one core could host. --bots adds matches played in-process by the random
+policy to load the server without clients; --load-test connects client
+matches to a running server.
+
+Examples:
+    python frog_server.py --bots 300
+    python frog_server.py --load-test 200 --variant quantumquest
+"""
+import argparse
+import asyncio
+import heapq
+import math
+import random
+import struct
+import time
+from array import array
+
+from frog_profile import PhaseStats
+from frog_sim import OUTCOME_CODES, Simulation, inputs_for, net_inputs
+from frog_tune import random_policy
+from frog_variants import VARIANTS, variant_config
+
+# Bytes after the length field, tick, score, outcome code, balls in play,
+# knight x1, y1, chest x1, y1
+UPDATE = struct.Struct("<HIiBHffff")
+MAX_BUFFERED = 64 * 1024  # Bytes queued for a client above which its updates are skipped
+
+
+class Match:
+    """One game hosted by the server, fed by a client or by the bot policy."""
+
+    def __init__(self, match_id, config, seed, writer=None):
+        self.id = match_id
+        self.config = config
+        self.sim = Simulation(config, seed)
+        self.writer = writer  # None for a bot match
+        self.rng = random.Random(seed) if writer is None else None
+        # Key presses since the last tick, coalesced as by Simulation.apply_inputs
+        self.steps = 0
+        self.jump = False
+        self.fall = False
+        self.closed = False
+
+    def tick(self):
+        """Step once with the queued key presses, or the bot's choice."""
+        sim = self.sim
+        if self.writer is None:
+            inputs = random_policy(sim, self.rng)
+        else:
+            inputs = inputs_for(self.steps, self.jump, self.fall)
+            self.steps = 0
+            self.jump = self.fall = False
+        sim.step(inputs)
+
+    def press(self, data):
+        """Fold bytes of key presses from the client into the next tick's input."""
+        steps, jump, fall = net_inputs(data)
+        self.steps += steps
+        self.jump = self.jump or jump
+        self.fall = self.fall or fall
+
+    def update(self):
+        """The state update sent to the client after a tick."""
+        sim = self.sim
+        rects = sim.rects
+        k = 4 * sim.knight
+        c = 4 * sim.chest
+        logs = array("f", rects[0:4 * sim.num_logs:4])
+        balls = array("f")
+        for ball in sim.balls:
+            balls.append(rects[4 * ball])
+            balls.append(rects[4 * ball + 1])
+        header = UPDATE.pack(UPDATE.size - 2 + 4 * (len(logs) + len(balls)), sim.tick, sim.score,
+                             OUTCOME_CODES[sim.outcome], len(sim.balls),
+                             rects[k], rects[k + 1], rects[c], rects[c + 1])
+        return b"".join((header, logs.tobytes(), balls.tobytes()))
+
+
+class MatchServer:
+    """Hosts matches and advances all of them from one scheduler timer."""
+
+    def __init__(self):
+        self.next_id = 0
+        self.due = []  # Heap of (due time, match id, match)
+        self.timer = None
+        self.matches = 0
+        self.lateness = PhaseStats()  # Nanoseconds each match tick ran after its due time
+        self.busy_ns = 0  # Time spent stepping matches since the last report
+        self.ticks = 0
+        self.skipped = 0  # Updates not sent to slow clients since the last report
+        self.last_report = time.perf_counter()
+
+    def add_match(self, config, seed, writer=None):
+        loop = asyncio.get_running_loop()
+        match = Match(self.next_id, config, seed, writer)
+        self.next_id += 1
+        self.matches += 1
+        # Ticks fall on a grid shared by all matches with the same tick length,
+        # so one wake-up serves all of them
+        tick = config.tick_ms / 1000
+        self.push(math.ceil(loop.time() / tick + 1) * tick, match)
+        return match
+
+    def push(self, due, match):
+        heapq.heappush(self.due, (due, match.id, match))
+        if self.due[0][2] is match:
+            self.arm()
+
+    def arm(self):
+        """Set the one timer for the earliest due match."""
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        if self.due:
+            self.timer = asyncio.get_running_loop().call_at(self.due[0][0], self.run_due)
+
+    def run_due(self):
+        """Timer callback: run every match whose tick is due."""
+        self.timer = None
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        start = time.perf_counter_ns()
+        due = self.due
+        while due and due[0][0] <= now:
+            when, _, match = heapq.heappop(due)
+            if match.closed:
+                continue
+            # Late by the timer's delay plus the matches stepped before it
+            self.lateness.add(int((now - when) * 1e9) + time.perf_counter_ns() - start)
+            cfg = match.config
+            tick = cfg.tick_ms / 1000
+            # Catch up on missed ticks, up to the same cap as the Tk loop
+            ticks = min(int((now - when) / tick) + 1, cfg.max_catch_up_ticks)
+            stepped = 0
+            while stepped < ticks and match.sim.outcome is None:
+                match.tick()
+                stepped += 1
+            self.ticks += stepped
+            if not self.finish_tick(match):
+                continue
+            when += ticks * tick
+            if when < now:
+                when = now + tick  # Too far behind: drop the lost time
+            heapq.heappush(due, (when, match.id, match))
+        self.busy_ns += time.perf_counter_ns() - start
+        self.arm()
+
+    def finish_tick(self, match):
+        """Send the update; returns whether the match goes on."""
+        sim = match.sim
+        if match.writer is None:
+            if sim.outcome is not None:
+                # Bots start a fresh game straight away to keep the load steady
+                match.sim = Simulation(match.config, match.rng.randrange(2 ** 32))
+            return True
+        if match.closed:
+            return False
+        # A client that stops reading would otherwise grow its buffer without limit;
+        # the update that ends the game is always sent
+        if sim.outcome is not None or match.writer.transport.get_write_buffer_size() <= MAX_BUFFERED:
+            match.writer.write(match.update())
+        else:
+            self.skipped += 1
+        if sim.outcome is not None:
+            self.close(match)
+            return False
+        return True
+
+    def close(self, match):
+        if not match.closed:
+            match.closed = True
+            self.matches -= 1
+            if match.writer is not None:
+                match.writer.close()
+
+    async def handle_client(self, reader, writer):
+        """Serve one client connection: JOIN, then key presses until it leaves."""
+        line = await reader.readline()
+        parts = line.decode(errors="replace").split()
+        if len(parts) not in (2, 3) or parts[0] != "JOIN" or parts[1] not in VARIANTS:
+            writer.write(b"ERR expected JOIN <variant> [seed]\n")
+            writer.close()
+            return
+        seed = int(parts[2]) if len(parts) == 3 and parts[2].isdigit() else random.randrange(2 ** 32)
+        config = variant_config(parts[1])
+        writer.write(f"OK {config.tick_ms} {config.num_rows * config.num_logs_per_row} "
+                     f"{config.max_balls}\n".encode())
+        match = self.add_match(config, seed, writer)
+        try:
+            while not match.closed:
+                data = await reader.read(256)
+                if not data:
+                    break
+                match.press(data)
+        except ConnectionError:
+            pass
+        finally:
+            self.close(match)
+
+    def report(self):
+        """Lateness and load since the last report, as a dict."""
+        now = time.perf_counter()
+        elapsed = now - self.last_report
+        busy = self.busy_ns / 1e9 / elapsed if elapsed else 0.0
+        p50, p99 = self.lateness.percentiles(50, 99)
+        stats = {
+            "matches": self.matches,
+            "ticks_per_sec": self.ticks / elapsed if elapsed else 0.0,
+            "lateness_p50_ms": p50 / 1e6,
+            "lateness_p99_ms": p99 / 1e6,
+            "lateness_max_ms": self.lateness.max_ns / 1e6,
+            "busy": busy,
+            # Matches one core could tick on time if the scheduler were always busy
+            "matches_per_core": self.matches / busy if busy else None,
+            "skipped_updates": self.skipped,
+        }
+        self.last_report = now
+        self.busy_ns = 0
+        self.ticks = 0
+        self.skipped = 0
+        self.lateness.max_ns = 0
+        return stats
+
+
+def format_report(stats):
+    per_core = stats["matches_per_core"]
+    per_core = "-" if per_core is None else f"{per_core:.0f}"
+    return (f"{stats['matches']} matches, {stats['ticks_per_sec']:.0f} ticks/s, lateness "
+            f"p50 {stats['lateness_p50_ms']:.2f} ms p99 {stats['lateness_p99_ms']:.2f} ms "
+            f"max {stats['lateness_max_ms']:.2f} ms, busy {stats['busy']:.0%}, ~{per_core} matches/core, "
+            f"{stats['skipped_updates']} updates skipped")
+
+
+async def serve(args):
+    server = MatchServer()
+    for index in range(args.bots):
+        server.add_match(variant_config(args.variant), args.seed + index)
+    listener = await asyncio.start_server(server.handle_client, args.host, args.port)
+    print(f"Serving on {args.host}:{args.port} with {args.bots} bot matches")
+    async with listener:
+        while True:
+            await asyncio.sleep(args.report)
+            print(format_report(server.report()), flush=True)
+
+
+async def play_client(host, port, variant, seed, duration, totals):
+    """A load-test client: random key presses, counting the updates it gets."""
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f"JOIN {variant} {seed}\n".encode())
+    reply = await reader.readline()
+    if not reply.startswith(b"OK"):
+        raise ConnectionError(reply.decode().strip())
+    rng = random.Random(seed)
+    end = time.perf_counter() + duration
+    try:
+        while time.perf_counter() < end:
+            size = UPDATE.unpack(await reader.readexactly(UPDATE.size))[0]
+            await reader.readexactly(size - UPDATE.size + 2)
+            totals["updates"] += 1
+            totals["bytes"] += size + 2
+            if rng.random() < 0.1:
+                writer.write(bytes([rng.choice((0, 1, 2, 2))]))
+    except (asyncio.IncompleteReadError, ConnectionError):
+        totals["finished"] += 1  # Game over, the server closed the match
+    writer.close()
+
+
+async def load_test(args):
+    totals = {"updates": 0, "bytes": 0, "finished": 0}
+    start = time.perf_counter()
+    await asyncio.gather(*(play_client(args.host, args.port, args.variant, args.seed + index, args.seconds, totals)
+                           for index in range(args.load_test)))
+    elapsed = time.perf_counter() - start
+    print(f"{args.load_test} clients: {totals['updates'] / elapsed:.0f} updates/s, "
+          f"{totals['bytes'] / elapsed / 1024:.0f} KiB/s, {totals['finished']} games finished")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Host headless Frog Jump matches over TCP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--variant", default="game", choices=sorted(VARIANTS),
+                        help="variant of the bot matches and load-test clients")
+    parser.add_argument("--bots", type=int, default=0, help="matches played in-process by the random policy")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--report", type=float, default=5.0, help="seconds between load reports")
+    parser.add_argument("--load-test", type=int, default=0, metavar="CLIENTS",
+                        help="connect this many client matches to a running server instead of serving")
+    parser.add_argument("--seconds", type=float, default=10.0, help="length of the load test")
+    args = parser.parse_args()
+    try:
+        asyncio.run(load_test(args) if args.load_test else serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,937 @@
+"""Headless simulation core shared by every Frog Jump variant.
+
+The whole world (logs, knight, chest, balls, score, win/lose) lives in plain
+Python objects here, so physics runs without a display and as fast as Python
+allows. The Tk window in frog_tk.py only draws from this state.
+"""
+import math
+import random
+import struct
+from array import array
+from itertools import chain
+from time import perf_counter_ns
+
+from frog_trace import BALL_HIT, CHEST, GAME_OVER, LAND, LOG_HIT
+
+# NumPy is only needed for vectorized_logs and takes far longer to import
+# than everything else here, so it is imported on first use
+np = None
+
+# Constants (defaults match game.py)
+WINDOW_WIDTH = 1000
+WINDOW_HEIGHT = 800
+LOG_WIDTH = 100
+LOG_HEIGHT = 20
+NUM_LOGS_PER_ROW = 3
+NUM_ROWS = 6
+INITIAL_LOG_SPEED = 6
+SPEED_INCREMENT = 0.3
+JUMP_DISTANCE = 100
+KNIGHT_WIDTH = 30
+KNIGHT_HEIGHT = 30
+GRAVITY = 0.5
+FAST_FALL_VELOCITY = -10
+MAX_FALL_VELOCITY = 10
+BALL_RADIUS = 10
+MAX_BALLS = 0  # No falling balls unless a variant turns them on
+
+# Player inputs accepted by Simulation.step
+LEFT = 0
+RIGHT = 1
+JUMP = 2
+DOWN = 3
+
+# Game outcomes
+WIN = "win"
+LOSE = "lose"
+OUTCOME_CODES = {None: 0, WIN: 1, LOSE: 2}
+OUTCOMES = {code: outcome for outcome, code in OUTCOME_CODES.items()}
+
+# Layout of Simulation.snapshot(): this header, then the RNG key, rects, log
+# speeds and log anchors (doubles), row orders and ball slots (int32).
+# Everything after the header is sized by the config.
+SNAPSHOT_MAGIC = b"FJS1"
+SNAPSHOT_HEADER = struct.Struct(
+    "<4s"  # Magic
+    "IIII"  # Entity slots, logs, ball slots, balls in play
+    "qqqqq"  # tick, score, chests_collected, spawn_countdown, rows_climbed
+    "dd"  # velocity_y, knight_dy
+    "BBBB"  # on_log, falling, bounced, outcome code
+    "Q"  # row_seed
+    "Bd"  # RNG: has a cached gauss value, the value
+)
+RNG_KEY = struct.Struct("<625I")  # Mersenne Twister key and position
+
+# Rule modules: a config setting's value -> the Simulation method that plays
+# that rule. They are looked up once per game (see build_systems), so the
+# tick itself never branches on the variant.
+FALL_RULES = {
+    "fast": "fall_fast", "next_row": "fall_to_next_row", "random_log": "fall_to_random_log",
+    "drop": "fall_drop", None: None,
+}
+SPAWN_RULES = {"drip": "spawn_drip", "rain": "spawn_rain"}
+
+
+class GameConfig:
+    """Tuning constants and rule switches for one game variant."""
+
+    def __init__(self, **overrides):
+        self.window_width = WINDOW_WIDTH
+        self.window_height = WINDOW_HEIGHT
+        self.log_width = LOG_WIDTH
+        self.log_height = LOG_HEIGHT
+        self.num_logs_per_row = NUM_LOGS_PER_ROW
+        self.num_rows = NUM_ROWS
+        self.initial_log_speed = INITIAL_LOG_SPEED
+        self.speed_increment = SPEED_INCREMENT
+        self.jump_distance = JUMP_DISTANCE
+        self.knight_width = KNIGHT_WIDTH
+        self.knight_height = KNIGHT_HEIGHT
+        self.move_step = 30  # Sideways step for Left/Right
+        self.gravity = GRAVITY
+        self.fast_fall_velocity = FAST_FALL_VELOCITY
+        self.max_fall_velocity = MAX_FALL_VELOCITY  # None means uncapped
+        self.bounce_velocity = None  # Velocity given when landing on a log, None to just stop
+        self.ball_radius = BALL_RADIUS
+        self.max_balls = MAX_BALLS
+        self.ball_mode = "drip"  # "drip" drops balls off logs, "rain" drops them from the sky
+        self.ball_speed = 5
+        self.ball_spawn_chance = 0.02  # Per tick, for "drip"
+        self.ball_spawn_interval = 150  # Ticks between spawns, for "rain"
+        self.chest_reward = 10
+        self.ball_penalty = 2
+        self.log_layout = "spaced"  # "spaced", "columns" or "edges"
+        self.log_speed_mode = "uniform"  # "uniform" in [-speed, speed] or "sign" for +/-speed
+        self.knight_start_x = LOG_WIDTH * NUM_LOGS_PER_ROW // 2
+        self.carry_factor = 0.5  # Share of the log's speed passed on to the knight
+        self.anchor_knight = False  # Pin the knight to the first log instead of landing checks
+        self.log_collisions = False  # Logs in the same row bounce off each other
+        self.fall_mode = "fast"  # Down key: "fast", "next_row", "random_log", "drop" or None
+        self.jump_mode = "move"  # "move" teleports up a row, "launch" needs a log under the knight
+        self.move_checks = True  # Check victory, gravity and chest right after each move
+        self.gravity_on_move = False
+        self.chest_every_tick = False
+        self.fall_limit = None  # Knight top y that ends the game, None for the window bottom
+        self.tick_ms = 50  # Physics tick length
+        self.render_ms = 16  # Delay between redraws, independent of the physics rate
+        self.max_catch_up_ticks = 5  # Ticks run per redraw at most before dropping lost time
+        self.vectorized_logs = False  # Move all logs with NumPy in one pass
+        self.show_final_score = False
+        self.endless = False  # Endless climb: no win, rows scroll down and new ones appear on top
+        self.scroll_row = 2  # Highest row the knight is shown on in endless mode
+        self.ball_color = "black"
+        for name, value in overrides.items():
+            if not hasattr(self, name):
+                raise TypeError(f"Unknown game setting: {name}")
+            setattr(self, name, value)
+
+    def row_y(self, row):
+        """Top y-coordinate of a row of logs (row 0 is the bottom one)."""
+        return self.window_height - (row + 1) * self.jump_distance
+
+    def initial_log_xs(self):
+        """Starting x-positions of the logs in a row."""
+        count = self.num_logs_per_row
+        if self.log_layout == "spaced":
+            spacing = (self.window_width - self.log_width * count) / (count + 1)
+            return [spacing * (i + 1) + self.log_width * i for i in range(count)]
+        if self.log_layout == "columns":
+            return [150 + i * (self.window_width // count) for i in range(count)]
+        # "edges": first log 150 from the left wall, last one 150 from the right
+        span = self.window_width - self.log_width - 300
+        return [150 + i * span / max(count - 1, 1) for i in range(count)]
+
+    def row_at(self, y):
+        """Lowest row whose top is at or above y, clamped to the rows that exist."""
+        row = math.ceil((self.window_height - y) / self.jump_distance - 1)
+        return min(max(row, 0), self.num_rows - 1)
+
+    def rows_touching(self, y1, y2):
+        """Rows whose logs can overlap the vertical span y1..y2.
+
+        Rows sit exactly jump_distance apart and logs only move sideways, so
+        this is plain arithmetic instead of a scan over every row.
+        """
+        first = math.ceil((self.window_height - y2) / self.jump_distance - 1)
+        last = math.floor((self.window_height - y1 + self.log_height) / self.jump_distance - 1)
+        return range(max(first, 0), min(last, self.num_rows - 1) + 1)
+
+
+def net_inputs(inputs):
+    """One tick's key presses as (sideways steps, jump, fall).
+
+    Left and right cancel out and repeated jumps or falls count once.
+    Simulation.apply_inputs and coalesce_inputs both go through this, so
+    they cannot drift apart.
+    """
+    return inputs.count(RIGHT) - inputs.count(LEFT), JUMP in inputs, DOWN in inputs
+
+
+def coalesce_inputs(inputs):
+    """The shortest list of inputs that Simulation.step applies like inputs.
+
+    Net moves first, then at most one jump and one fall, so a recording of
+    it replays identically.
+    """
+    return inputs_for(*net_inputs(inputs))
+
+
+def inputs_for(steps, jump, fall):
+    """The shortest list of inputs that net_inputs turns into (steps, jump, fall)."""
+    inputs = [RIGHT if steps > 0 else LEFT] * abs(steps)
+    if jump:
+        inputs.append(JUMP)
+    if fall:
+        inputs.append(DOWN)
+    return inputs
+
+
+def sweep_time(ax1, ay1, ax2, ay2, dx, dy, bx1, by1, bx2, by2):
+    """Time of impact of box a moving by (dx, dy) against a still box b.
+
+    Returns the fraction of the move, from 0 to 1, at which the boxes first
+    touch, or None if they do not touch during the move or already overlap
+    at its start. Touching edges count as a hit, as in Simulation.overlaps.
+    """
+    if dx > 0:
+        x_in, x_out = (bx1 - ax2) / dx, (bx2 - ax1) / dx
+    elif dx < 0:
+        x_in, x_out = (bx2 - ax1) / dx, (bx1 - ax2) / dx
+    elif ax2 < bx1 or ax1 > bx2:
+        return None
+    else:
+        x_in, x_out = -math.inf, math.inf
+    if dy > 0:
+        y_in, y_out = (by1 - ay2) / dy, (by2 - ay1) / dy
+    elif dy < 0:
+        y_in, y_out = (by2 - ay1) / dy, (by1 - ay2) / dy
+    elif ay2 < by1 or ay1 > by2:
+        return None
+    else:
+        y_in, y_out = -math.inf, math.inf
+    t_in = max(x_in, y_in)
+    if t_in < 0 or t_in > 1 or t_in > min(x_out, y_out):
+        return None
+    return t_in
+
+
+class Simulation:
+    """One Frog Jump game, advanced a tick at a time with step().
+
+    Every rectangle lives in ``rects``, a flat array('d') holding
+    x1, y1, x2, y2 for each entity slot. Logs take the first slots in row
+    order (slot = row * logs_per_row + column), then the knight, the chest
+    and a fixed block of ball slots. Collision checks read only from this
+    store; the renderer copies it to the screen.
+    """
+
+    def __init__(self, config=None, seed=None, tracer=None, profiler=None):
+        self.config = config or GameConfig()
+        self.random = random.Random(seed)
+        self.tracer = tracer  # Optional frog_trace.Tracer for collision diagnostics
+        self.profiler = profiler  # Optional frog_profile.PhaseProfiler timing each phase
+        cfg = self.config
+
+        # Entity slots
+        self.num_logs = cfg.num_rows * cfg.num_logs_per_row
+        self.knight = self.num_logs
+        self.chest = self.knight + 1
+        self.first_ball = self.chest + 1
+        self.rects = array("d", bytes(8 * 4 * (self.first_ball + cfg.max_balls)))
+
+        # Logs, row by row
+        for row in range(cfg.num_rows):
+            row_y = cfg.row_y(row)
+            for col, x in enumerate(cfg.initial_log_xs()):
+                self.set_rect(self.log_slot(row, col), x, row_y, cfg.log_width, cfg.log_height)
+        self.log_speeds = array("d", [self.initial_log_speed() for _ in range(self.num_logs)])
+        self.rows_climbed = 0
+        self.row_seed = 0
+        if cfg.endless:
+            # Rows are built by depth from their own seed; see generate_row
+            self.row_seed = self.random.getrandbits(64)
+            for row in range(cfg.num_rows):
+                self.generate_row(row, row)
+        self.log_x1 = self.log_x2 = self.log_speed_grid = None
+        # Log slots of each row sorted by left edge, for the collision sweep
+        self.row_orders = [list(range(self.log_slot(row, 0), self.log_slot(row + 1, 0)))
+                           for row in range(cfg.num_rows)]
+        if cfg.vectorized_logs:
+            self.init_log_arrays()
+
+        # Knight starts standing on the bottom row
+        knight_y = cfg.window_height - cfg.jump_distance - cfg.knight_height
+        self.set_rect(self.knight, cfg.knight_start_x, knight_y, cfg.knight_width, cfg.knight_height)
+        self.velocity_y = 0
+        self.knight_dy = 0  # How far gravity moved the knight this tick
+        self.on_log = cfg.anchor_knight
+        self.falling = False
+        self.bounced = False
+
+        self.place_chest()
+        # Ball pool: slots in play, in no particular order, and free slots
+        self.balls = []
+        self.free_balls = list(range(self.first_ball + cfg.max_balls - 1, self.first_ball - 1, -1))
+        self.spawn_countdown = 0
+        self.score = 0
+        self.chests_collected = 0
+        self.outcome = None
+        self.tick = 0
+
+        # Per log, the tick, x1 and speed its closed-form path starts from
+        self.log_anchors = array("d", bytes(8 * 3 * self.num_logs))
+        self.reanchor_logs()
+
+        self.build_systems()
+
+    def build_systems(self):
+        """Pick the rules of the variant and list the systems run every tick.
+
+        step() calls each system in ``systems`` in order; one that returns
+        True (the game-over check) ends the tick. ``system_names`` holds the
+        profiler phase of each.
+        """
+        cfg = self.config
+        self.fall_rule = self.pick_rule(FALL_RULES, "fall_mode")
+        self.land_on_log = self.bounce_off_log if cfg.bounce_velocity is not None else self.stop_on_log
+        self.fall_cap = math.inf if cfg.max_fall_velocity is None else cfg.max_fall_velocity
+        self.death_y = cfg.window_height if cfg.fall_limit is None else cfg.fall_limit
+        self.spawn_rule = self.pick_rule(SPAWN_RULES, "ball_mode") if cfg.max_balls > 0 else None
+
+        systems = [("sim.logs", self.move_logs_vectorized if cfg.vectorized_logs else self.move_logs)]
+        if cfg.log_collisions:
+            systems.append(("sim.log_hits", self.handle_all_log_collisions))
+        systems.append(("sim.knight", self.ride_first_log if cfg.anchor_knight else self.update_knight))
+        if cfg.endless:
+            systems.append(("sim.scroll", self.follow_knight))
+        if cfg.max_balls > 0:
+            systems.append(("sim.balls", self.update_balls))
+        if cfg.chest_every_tick:
+            systems.append(("sim.chest", self.collect_chest))
+        systems.append(("sim.checks", self.check_game_over))
+        if self.spawn_rule is not None:
+            systems.append(("sim.spawn", self.spawn_rule))
+        self.system_names = [name for name, _ in systems]
+        self.systems = [system for _, system in systems]
+
+    def pick_rule(self, rules, setting):
+        """The method playing the rule the config chose for a setting."""
+        value = getattr(self.config, setting)
+        if value not in rules:
+            raise ValueError(f"Unknown {setting}: {value!r}")
+        return rules[value] and getattr(self, rules[value])
+
+    def snapshot(self):
+        """Pack the whole game state, RNG included, into a bytes blob.
+
+        The layout is fixed for a given config (see SNAPSHOT_HEADER) and
+        building it is a handful of buffer copies, cheap enough to take
+        every tick for rollback or search.
+        """
+        version, key, gauss_next = self.random.getstate()
+        header = SNAPSHOT_HEADER.pack(
+            SNAPSHOT_MAGIC, len(self.rects) // 4, self.num_logs, self.config.max_balls, len(self.balls),
+            self.tick, self.score, self.chests_collected, self.spawn_countdown, self.rows_climbed,
+            self.velocity_y, self.knight_dy, self.on_log, self.falling, self.bounced, OUTCOME_CODES[self.outcome],
+            self.row_seed, gauss_next is not None, gauss_next or 0.0,
+        )
+        return b"".join((
+            header, RNG_KEY.pack(*key), self.rects.tobytes(), self.log_speeds.tobytes(),
+            self.log_anchors.tobytes(), array("i", chain.from_iterable(self.row_orders)).tobytes(),
+            array("i", self.balls + self.free_balls).tobytes(),
+        ))
+
+    def restore(self, blob):
+        """Put the game back in the state of a snapshot() blob.
+
+        The entity arrays are overwritten in place, so NumPy views and a
+        renderer drawing from this Simulation keep working. A blob built
+        for another layout raises ValueError and leaves the game untouched.
+        """
+        num_logs = self.num_logs
+        max_balls = self.config.max_balls
+        size = (SNAPSHOT_HEADER.size + RNG_KEY.size
+                + 8 * (len(self.rects) + len(self.log_speeds) + len(self.log_anchors))
+                + 4 * (num_logs + max_balls))
+        if len(blob) != size:
+            raise ValueError("Snapshot does not match this game's layout")
+        (magic, slots, logs, ball_slots, ball_count, tick, score, chests_collected, spawn_countdown,
+         rows_climbed, velocity_y, knight_dy, on_log, falling, bounced, outcome,
+         row_seed, has_gauss, gauss_next) = SNAPSHOT_HEADER.unpack_from(blob)
+        if (magic != SNAPSHOT_MAGIC or (slots, logs, ball_slots) != (len(self.rects) // 4, num_logs, max_balls)
+                or ball_count > max_balls or outcome not in OUTCOMES):
+            raise ValueError("Snapshot does not match this game's layout")
+        self.tick = tick
+        self.score = score
+        self.chests_collected = chests_collected
+        self.spawn_countdown = spawn_countdown
+        self.rows_climbed = rows_climbed
+        self.velocity_y = velocity_y
+        self.knight_dy = knight_dy
+        self.row_seed = row_seed
+        self.on_log = bool(on_log)
+        self.falling = bool(falling)
+        self.bounced = bool(bounced)
+        self.outcome = OUTCOMES[outcome]
+
+        view = memoryview(blob)
+        pos = SNAPSHOT_HEADER.size
+        self.random.setstate((3, RNG_KEY.unpack_from(blob, pos), gauss_next if has_gauss else None))
+        pos += RNG_KEY.size
+        for store in (self.rects, self.log_speeds, self.log_anchors):
+            size = 8 * len(store)
+            memoryview(store).cast("B")[:] = view[pos:pos + size]
+            pos += size
+
+        orders = array("i")
+        orders.frombytes(view[pos:pos + 4 * num_logs])
+        pos += 4 * num_logs
+        per_row = self.config.num_logs_per_row
+        self.row_orders = [orders[start:start + per_row].tolist() for start in range(0, num_logs, per_row)]
+        slots = array("i")
+        slots.frombytes(view[pos:pos + 4 * max_balls])
+        self.balls = slots[:ball_count].tolist()
+        self.free_balls = slots[ball_count:].tolist()
+
+    @property
+    def mission_completed(self):
+        return self.outcome is not None
+
+    def log_slot(self, row, col):
+        return row * self.config.num_logs_per_row + col
+
+    def log_position(self, slot):
+        """The (row, column) of a log slot."""
+        return divmod(slot, self.config.num_logs_per_row)
+
+    def rect(self, slot):
+        """The [x1, y1, x2, y2] coordinates of an entity slot."""
+        i = 4 * slot
+        return self.rects[i:i + 4]
+
+    def set_rect(self, slot, x, y, width, height):
+        i = 4 * slot
+        self.rects[i] = x
+        self.rects[i + 1] = y
+        self.rects[i + 2] = x + width
+        self.rects[i + 3] = y + height
+
+    def move_rect(self, slot, dx, dy):
+        i = 4 * slot
+        rects = self.rects
+        rects[i] += dx
+        rects[i + 1] += dy
+        rects[i + 2] += dx
+        rects[i + 3] += dy
+
+    def overlaps(self, a, b):
+        """Check if the rectangles in two slots touch or overlap."""
+        r = self.rects
+        a *= 4
+        b *= 4
+        return not (r[a + 2] < r[b] or r[a] > r[b + 2] or r[a + 3] < r[b + 1] or r[a + 1] > r[b + 3])
+
+    def initial_log_speed(self, speed=None, rng=None):
+        speed = self.config.initial_log_speed if speed is None else speed
+        rng = rng or self.random
+        if self.config.log_speed_mode == "sign":
+            return rng.choice([speed, -speed])
+        return rng.uniform(-speed, speed)
+
+    def generate_row(self, row, depth):
+        """Fill a row with the logs for the given height in endless mode.
+
+        Every depth draws from its own RNG, seeded from the game's seed, so a
+        game builds the same tower however its rows get recycled. Log speed
+        grows by speed_increment for every row climbed.
+        """
+        cfg = self.config
+        rng = random.Random(self.row_seed + depth)
+        speed = cfg.initial_log_speed + cfg.speed_increment * depth
+        row_y = cfg.row_y(row)
+        for col, x in enumerate(cfg.initial_log_xs()):
+            slot = self.log_slot(row, col)
+            self.set_rect(slot, x, row_y, cfg.log_width, cfg.log_height)
+            self.log_speeds[slot] = self.initial_log_speed(speed, rng)
+
+    def follow_knight(self):
+        """Scroll the world in endless mode so the knight stays at or below scroll_row."""
+        rows = self.get_knight_row() - self.config.scroll_row
+        if rows > 0:
+            self.scroll(rows)
+
+    def scroll(self, rows):
+        """Move the world down by whole rows, recycling the rows that drop off.
+
+        Each row's slots take over the logs of the row ``rows`` above, and
+        the freed rows at the top are generated afresh. The number of slots,
+        the per-tick work and the renderer's canvas items therefore stay the
+        same however high the knight climbs.
+        """
+        cfg = self.config
+        rects = self.rects
+        speeds = self.log_speeds
+        recycled = min(rows, cfg.num_rows)
+        offset = recycled * cfg.num_logs_per_row
+        for slot in range(self.num_logs - offset):
+            i = 4 * slot
+            j = 4 * (slot + offset)
+            rects[i] = rects[j]
+            rects[i + 2] = rects[j + 2]
+            speeds[slot] = speeds[slot + offset]
+        kept = cfg.num_rows - recycled
+        self.row_orders[:kept] = [[slot - offset for slot in order] for order in self.row_orders[recycled:]]
+        self.rows_climbed += rows
+        for row in range(kept, cfg.num_rows):
+            self.generate_row(row, self.rows_climbed + row)
+            self.row_orders[row] = list(range(self.log_slot(row, 0), self.log_slot(row + 1, 0)))
+        self.reanchor_logs()
+
+        # Everything else moves down with the logs
+        shift = rows * cfg.jump_distance
+        self.move_rect(self.knight, 0, shift)
+        self.move_rect(self.chest, 0, shift)
+        for ball in self.balls:
+            self.move_rect(ball, 0, shift)
+        if rects[4 * self.chest + 1] >= cfg.window_height:
+            self.place_chest()
+
+    def place_chest(self):
+        """Place the chest above a random log in a random row."""
+        cfg = self.config
+        row = self.random.randint(0, cfg.num_rows - 1)
+        log = 4 * self.log_slot(row, self.random.randrange(cfg.num_logs_per_row))
+        chest_x = self.rects[log] + (cfg.log_width - cfg.knight_width) // 2  # Center chest on log
+        chest_y = max(self.rects[log + 1] - cfg.knight_height - 10, 0)  # Slight offset above the log, kept on screen
+        self.set_rect(self.chest, chest_x, chest_y, cfg.knight_width, cfg.knight_height)
+
+    def step(self, inputs=()):
+        """Apply the tick's inputs (coalesced), then advance the world by one tick."""
+        if self.outcome is not None:
+            return self.outcome
+        if inputs:
+            self.apply_inputs(inputs)
+            if self.outcome is not None:
+                return self.outcome
+        self.tick += 1
+        if self.profiler is not None:
+            return self.profiled_tick()
+        for system in self.systems:
+            if system():
+                break
+        return self.outcome
+
+    def profiled_tick(self):
+        """The same systems as step(), timing each into the profiler."""
+        add = self.profiler.add
+        clock = perf_counter_ns
+        for name, system in zip(self.system_names, self.systems):
+            start = clock()
+            over = system()
+            add(name, clock() - start)
+            if over:
+                break
+        return self.outcome
+
+    def check_game_over(self):
+        """End the game if the knight has fallen out of the world."""
+        if self.rects[4 * self.knight + 1] < self.death_y:
+            return False
+        self.velocity_y = 0
+        self.outcome = LOSE
+        if self.tracer is not None:
+            self.tracer.emit_slot(self.tick, GAME_OVER, self.knight, 0, self.rects)
+        return True
+
+    def apply_inputs(self, inputs):
+        """Apply one tick's key presses, coalesced.
+
+        Key repeat can queue any number of presses per tick. Left and right
+        become a single move by their net distance, and repeated jumps or
+        falls count once, always in the order move, jump, fall, so the cost
+        is bounded and the result does not depend on how presses interleaved.
+        A finished game ignores them.
+        """
+        if self.outcome is not None:
+            return
+        steps, jump, fall = net_inputs(inputs)
+        if steps:
+            self.move_knight(steps * self.config.move_step, 0)
+        if jump and self.outcome is None:
+            self.jump_knight()
+        if fall and self.outcome is None:
+            self.fall()
+
+    def init_log_arrays(self):
+        """Set up (rows, logs per row) NumPy views onto the log store.
+
+        The views share memory with ``rects`` and ``log_speeds``, so the
+        vectorized update needs no copying and everything else keeps
+        reading the array('d') store as usual.
+        """
+        global np
+        if np is None:
+            try:
+                import numpy as np
+            except ImportError:
+                raise ImportError("vectorized_logs needs NumPy installed") from None
+        shape = (self.config.num_rows, self.config.num_logs_per_row)
+        logs = np.frombuffer(self.rects, dtype=np.float64)[:4 * self.num_logs].reshape(shape + (4,))
+        self.log_x1 = logs[..., 0]
+        self.log_x2 = logs[..., 2]
+        self.log_speed_grid = np.frombuffer(self.log_speeds, dtype=np.float64).reshape(shape)
+
+    def move_logs_vectorized(self):
+        """move_logs() for vectorized_logs, in one NumPy pass over the views."""
+        speeds = self.log_speed_grid
+        self.log_x1 += speeds
+        self.log_x2 += speeds
+        np.negative(speeds, out=speeds, where=(self.log_x2 >= self.config.window_width) | (self.log_x1 <= 0))
+
+    def move_logs(self):
+        """Move every log and bounce it off the walls."""
+        width = self.config.window_width
+        rects = self.rects
+        speeds = self.log_speeds
+        for slot in range(self.num_logs):
+            i = 4 * slot
+            speed = speeds[slot]
+            rects[i] += speed
+            rects[i + 2] += speed
+            if rects[i + 2] >= width or rects[i] <= 0:
+                speeds[slot] = -speed
+
+    def handle_all_log_collisions(self):
+        for row in range(self.config.num_rows):
+            self.handle_log_collisions(row)
+
+    def handle_log_collisions(self, row):
+        """Reverse the speed of a log once for every log it hits in its row.
+
+        Sweep and prune: the row's slots are kept sorted by left edge, so each
+        log is only compared with the logs that start before it ends. Logs
+        barely change order between ticks, so the insertion sort that keeps
+        the order up to date is close to linear.
+        """
+        rects = self.rects
+        speeds = self.log_speeds
+        order = self.row_orders[row]
+        count = len(order)
+        for i in range(1, count):
+            slot = order[i]
+            x = rects[4 * slot]
+            j = i - 1
+            while j >= 0 and rects[4 * order[j]] > x:
+                order[j + 1] = order[j]
+                j -= 1
+            order[j + 1] = slot
+
+        # Logs in a row share their y-span, so x-overlap is the whole test
+        for i in range(count):
+            a = order[i]
+            right = rects[4 * a + 2]
+            for j in range(i + 1, count):
+                b = order[j]
+                if rects[4 * b] > right:
+                    break
+                if self.tracer is not None:
+                    self.tracer.emit_slot(self.tick, LOG_HIT, a, b, rects)
+                speeds[a] = -speeds[a]
+                speeds[b] = -speeds[b]
+                self.anchor_log(a)
+                self.anchor_log(b)
+
+    def anchor_log(self, slot):
+        """Start a log's closed-form path from its current state."""
+        i = 3 * slot
+        self.log_anchors[i] = self.tick
+        self.log_anchors[i + 1] = self.rects[4 * slot]
+        self.log_anchors[i + 2] = self.log_speeds[slot]
+
+    def reanchor_logs(self):
+        for slot in range(self.num_logs):
+            self.anchor_log(slot)
+
+    def log_state(self, slot, tick):
+        """The x1 and speed a log will have after the given tick, in O(1).
+
+        A log moves a fixed step per tick and turns round on the first tick
+        it ends at or past a wall, so its position is a triangle wave over
+        the lattice x0 + j * step. The path starts from the log's anchor (its
+        state at tick 0 or after its last hit with another log) and matches
+        stepping the simulation up to float rounding. Logs that hit each
+        other later than the anchor are not foreseen.
+        """
+        anchors = self.log_anchors
+        i = 3 * slot
+        start, x, speed = int(anchors[i]), anchors[i + 1], anchors[i + 2]
+        if tick < start:
+            raise ValueError(f"Log {slot} is only known from tick {start}")
+        step = abs(speed)
+        if step == 0:
+            return x, speed
+        cfg = self.config
+        direction = 1 if speed > 0 else -1
+        # Lattice indices of the last position touching the left wall and
+        # the first touching the right wall
+        left = math.floor(-x / step)
+        right = math.ceil((cfg.window_width - cfg.log_width - x) / step)
+        # The first turn may be right next to the start, past the usual turning point
+        first = max(right, 1) if direction > 0 else min(left, -1)
+        first_ticks = abs(first)
+        other = left if direction > 0 else right
+        settle_ticks = first_ticks + abs(first - other)
+
+        ticks = tick - start
+        if ticks < first_ticks:
+            j, heading = direction * ticks, direction
+        elif ticks < settle_ticks:
+            j, heading = first - direction * (ticks - first_ticks), -direction
+        else:
+            # Steady back and forth between the walls, starting from `other`
+            half = right - left
+            phase = (ticks - settle_ticks) % (2 * half)
+            if phase < half:
+                j, heading = other + direction * phase, direction
+            else:
+                j, heading = other + direction * (2 * half - phase), -direction
+        return x + j * step, heading * step
+
+    def update_knight(self):
+        """Land the knight on logs, carry it along, and apply gravity."""
+        self.check_knight_on_log()
+        dy = self.apply_gravity()
+        if dy:
+            hit = self.knight_time_of_impact(dy)
+            if hit is not None:
+                # Stop on the surface of the log instead of passing through it
+                log = 4 * hit[1]
+                k = 4 * self.knight
+                dy = self.rects[log + 1] - self.rects[k + 3] if dy > 0 else self.rects[log + 3] - self.rects[k + 1]
+        self.knight_dy = dy
+        self.move_rect(self.knight, 0, dy)
+
+    def ride_first_log(self):
+        """update_knight() for anchor_knight: ride along with the first log, or fall."""
+        rects = self.rects
+        if self.on_log:
+            self.move_rect(self.knight, rects[0] - rects[4 * self.knight], 0)
+            self.knight_dy = 0
+            return
+        dy = self.knight_dy = self.apply_gravity()
+        self.move_rect(self.knight, 0, dy)
+
+    def apply_gravity(self):
+        """Speed up the fall unless the knight stands on a log; returns this tick's fall."""
+        if self.falling or not self.on_log:
+            velocity = self.velocity_y + self.config.gravity
+            self.velocity_y = velocity if velocity < self.fall_cap else self.fall_cap
+        return self.velocity_y
+
+    def knight_time_of_impact(self, dy):
+        """First log the knight hits when moving by dy.
+
+        Every log in the rows the move sweeps is tested and the earliest
+        time of impact wins, so a long fall stops at the first log in its
+        path even when it would end inside a lower one. Returns (time of
+        impact, log slot), or None when no log is hit or the knight already
+        overlaps a log at the start of the move, in which case the usual
+        overlap test handles it.
+        """
+        cfg = self.config
+        rects = self.rects
+        k = 4 * self.knight
+        kx1, ky1, kx2, ky2 = rects[k], rects[k + 1], rects[k + 2], rects[k + 3]
+        per_row = cfg.num_logs_per_row
+        first = None
+        for row in cfg.rows_touching(min(ky1, ky1 + dy), max(ky2, ky2 + dy)):
+            for slot in range(row * per_row, (row + 1) * per_row):
+                i = 4 * slot
+                lx1, ly1, lx2, ly2 = rects[i], rects[i + 1], rects[i + 2], rects[i + 3]
+                if kx2 < lx1 or kx1 > lx2:
+                    continue
+                if not (ky2 < ly1 or ky1 > ly2):
+                    return None
+                t = sweep_time(kx1, ky1, kx2, ky2, 0, dy, lx1, ly1, lx2, ly2)
+                if t is not None and (first is None or t < first[0]):
+                    first = (t, slot)
+        return first
+
+    def check_knight_on_log(self):
+        """Check if the knight is on a log and move it along with that log.
+
+        Only the logs in the rows the knight's height spans are tested.
+        """
+        cfg = self.config
+        rects = self.rects
+        k = 4 * self.knight
+        kx1, ky1, kx2, ky2 = rects[k], rects[k + 1], rects[k + 2], rects[k + 3]
+        per_row = cfg.num_logs_per_row
+        self.on_log = False
+        for row in cfg.rows_touching(ky1, ky2):
+            for slot in range(row * per_row, (row + 1) * per_row):
+                i = 4 * slot
+                if kx2 < rects[i] or kx1 > rects[i + 2] or ky2 < rects[i + 1] or ky1 > rects[i + 3]:
+                    continue
+                self.on_log = True
+                if self.tracer is not None:
+                    self.tracer.emit_slot(self.tick, LAND, self.knight, slot, rects)
+                self.move_rect(self.knight, self.log_speeds[slot] * cfg.carry_factor, 0)
+                self.land_on_log()
+                return
+        self.bounced = False
+
+    def stop_on_log(self):
+        """Landing rule: stop falling."""
+        self.velocity_y = 0
+
+    def bounce_off_log(self):
+        """Landing rule with bounce_velocity: bounce once per landing."""
+        if not self.bounced:
+            self.velocity_y = self.config.bounce_velocity
+            self.bounced = True
+
+    def move_knight(self, dx, dy):
+        """Move the knight and check for victory, gravity and the chest."""
+        cfg = self.config
+        self.move_rect(self.knight, dx, dy)
+        if cfg.endless:
+            self.follow_knight()
+        if not cfg.move_checks:
+            return
+
+        if self.rects[4 * self.knight + 1] <= 0:
+            self.outcome = WIN
+            if self.tracer is not None:
+                self.tracer.emit_slot(self.tick, GAME_OVER, self.knight, 1, self.rects)
+            return
+        if cfg.gravity_on_move and not self.on_log:
+            self.velocity_y += cfg.gravity
+        self.collect_chest()
+
+    def jump_knight(self):
+        cfg = self.config
+        if cfg.jump_mode == "launch":
+            # Jumping needs a log to push off from
+            if self.on_log:
+                self.velocity_y = cfg.fast_fall_velocity
+                self.move_knight(0, -cfg.jump_distance)
+                self.on_log = False
+        else:
+            self.move_knight(0, -cfg.jump_distance)
+
+    def fall(self):
+        """Handle the Down key according to the variant's fall mode."""
+        if self.fall_rule is not None:
+            self.fall_rule()
+
+    def fall_fast(self):
+        self.falling = True
+
+    def fall_to_next_row(self):
+        """Drop onto the row below if a log there is under the knight."""
+        cfg = self.config
+        rects = self.rects
+        k = 4 * self.knight
+        row = self.get_knight_row()
+        if row > 0:
+            for col in range(cfg.num_logs_per_row):
+                log = 4 * self.log_slot(row - 1, col)
+                if rects[log] <= rects[k + 2] and rects[log + 2] >= rects[k]:
+                    self.move_rect(self.knight, 0, rects[log + 1] - cfg.knight_height - rects[k + 1])
+                    self.velocity_y = 0
+                    return
+
+    def fall_to_random_log(self):
+        cfg = self.config
+        rects = self.rects
+        k = 4 * self.knight
+        row = self.random.randint(0, cfg.num_rows - 1)
+        log = 4 * self.log_slot(row, self.random.randint(0, cfg.num_logs_per_row - 1))
+        self.move_rect(self.knight, rects[log] - rects[k], rects[log + 1] - rects[k + 1])
+        self.velocity_y = 0
+        self.on_log = True
+
+    def fall_drop(self):
+        """Drop a row while in the air, landing straight away."""
+        if not self.on_log:
+            self.on_log = True
+            self.velocity_y = 0
+            self.move_rect(self.knight, 0, self.config.jump_distance)
+
+    def get_knight_row(self):
+        """Row the knight is standing on, judged by its feet."""
+        return self.config.row_at(self.rects[4 * self.knight + 3])
+
+    def collect_chest(self):
+        """Score the chest if the knight touches it and place a new one."""
+        if self.overlaps(self.knight, self.chest):
+            if self.tracer is not None:
+                self.tracer.emit_slot(self.tick, CHEST, self.knight, self.chest, self.rects)
+            self.score += self.config.chest_reward
+            self.chests_collected += 1
+            self.place_chest()
+
+    def update_balls(self):
+        """Move balls down and check for hits on the knight.
+
+        Finished balls are swap-removed: the last ball in play takes their
+        place in ``balls`` and their slot goes back on the free list, so
+        nothing is allocated per tick.
+        """
+        cfg = self.config
+        rects = self.rects
+        balls = self.balls
+        bottom = cfg.window_height
+        i = 0
+        while i < len(balls):
+            ball = balls[i]
+            self.move_rect(ball, 0, cfg.ball_speed)
+            if self.overlaps(self.knight, ball) or self.ball_swept_knight(ball):
+                if self.tracer is not None:
+                    self.tracer.emit_slot(self.tick, BALL_HIT, self.knight, ball, rects)
+                self.score -= cfg.ball_penalty
+            elif rects[4 * ball + 1] < bottom:
+                i += 1
+                continue
+            balls[i] = balls[-1]
+            balls.pop()
+            self.free_balls.append(ball)
+
+    def ball_swept_knight(self, ball):
+        """Whether a ball passed through the knight during this tick.
+
+        Sweeps the ball's move relative to the knight's fall, so fast balls
+        or large ticks cannot skip over it.
+        """
+        rects = self.rects
+        dy = self.config.ball_speed - self.knight_dy
+        b = 4 * ball
+        k = 4 * self.knight
+        return sweep_time(rects[b], rects[b + 1] - dy, rects[b + 2], rects[b + 3] - dy, 0, dy,
+                          rects[k], rects[k + 1], rects[k + 2], rects[k + 3]) is not None
+
+    def spawn_rain(self):
+        """Spawn rule "rain": a ball from the sky every ball_spawn_interval ticks."""
+        cfg = self.config
+        self.spawn_countdown -= 1
+        if self.spawn_countdown > 0:
+            return
+        self.spawn_countdown = cfg.ball_spawn_interval
+        if self.free_balls:
+            x = self.random.randint(0, cfg.window_width - cfg.ball_radius)
+            ball = self.free_balls.pop()
+            self.set_rect(ball, x, 0, cfg.ball_radius * 2, cfg.ball_radius * 2)
+            self.balls.append(ball)
+
+    def spawn_drip(self):
+        """Spawn rule "drip": now and then a ball drops off a random log."""
+        cfg = self.config
+        if self.random.random() < cfg.ball_spawn_chance and self.free_balls:
+            row = self.random.randint(0, cfg.num_rows - 1)
+            log = 4 * self.log_slot(row, self.random.randrange(cfg.num_logs_per_row))
+            x = self.rects[log] + (cfg.log_width - cfg.ball_radius) // 2  # Center the ball on the log
+            y = self.rects[log + 1] - cfg.ball_radius
+            ball = self.free_balls.pop()
+            self.set_rect(ball, x, y, cfg.ball_radius, cfg.ball_radius)
+            self.balls.append(ball)
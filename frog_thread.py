@@ -0,0 +1,148 @@
+"""Run a Simulation on its own thread at a fixed tick rate.
+
+SimulationThread owns the Simulation once started: only its thread steps
+or reads it. Key presses and commands reach it through a deque, which
+CPython appends to and pops from atomically, so the single producer (the
+UI thread) and the single consumer need no lock. Presses queued since the
+last tick are coalesced and applied together at the start of the next. After every tick the
+thread publishes what a renderer needs into one of two preallocated
+StateBuffers and flips ``front`` to it. Readers copy the front buffer into
+their own StateBuffer with latest(); a sequence number, odd while a buffer
+is being written, tells them to retry if the copy raced with a write.
+
+The UI can stall for as long as it likes: physics keeps its tick rate,
+catching up by at most max_catch_up_ticks after the thread itself was
+starved.
+"""
+import threading
+import time
+from array import array
+from collections import deque
+
+from frog_sim import coalesce_inputs
+
+
+class StateBuffer:
+    """Everything the renderer draws for one tick."""
+
+    def __init__(self, sim):
+        self.seq = 0  # Odd while the buffer is being written
+        self.prev_rects = array("d", sim.rects)  # Rects before the tick, for interpolation
+        self.rects = array("d", sim.rects)
+        self.balls = array("i", bytes(4 * sim.config.max_balls))  # Slots in play, ball_count of them
+        self.ball_count = 0
+        self.score = 0
+        self.outcome = None
+        self.tick = 0
+        self.time = time.perf_counter()  # When the tick was published
+
+    def copy_from(self, other):
+        self.prev_rects[:] = other.prev_rects
+        self.rects[:] = other.rects
+        self.balls[:] = other.balls
+        self.ball_count = other.ball_count
+        self.score = other.score
+        self.outcome = other.outcome
+        self.tick = other.tick
+        self.time = other.time
+
+
+class SimulationThread:
+    """Steps a Simulation on a background thread and publishes each tick."""
+
+    def __init__(self, sim, recorder=None):
+        self.sim = sim
+        self.recorder = recorder  # frog_replay.Recorder noting each press at its tick
+        self.inputs = deque()  # Actions (ints) and commands (callables taking the sim)
+        self.before = array("d", sim.rects)
+        self.buffers = [StateBuffer(sim), StateBuffer(sim)]
+        self.front = 0
+        self.stopping = threading.Event()
+        self.thread = threading.Thread(target=self.run, name="simulation", daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        """Stop stepping and wait for the thread; the Simulation is the caller's again."""
+        self.stopping.set()
+        if self.thread.is_alive():
+            self.thread.join()
+
+    def send(self, item):
+        """Queue an action or a command for the start of the next tick."""
+        self.inputs.append(item)
+
+    def run(self):
+        sim = self.sim
+        cfg = sim.config
+        tick = cfg.tick_ms / 1000
+        clock = time.perf_counter
+        next_time = clock() + tick
+        while not self.stopping.is_set() and sim.outcome is None:
+            delay = next_time - clock()
+            if delay > 0:
+                self.stopping.wait(delay)
+                continue
+            ticks = 0
+            while next_time <= clock() and ticks < cfg.max_catch_up_ticks and sim.outcome is None:
+                self.step()
+                next_time += tick
+                ticks += 1
+            now = clock()
+            if next_time <= now:
+                next_time = now + tick  # Starved for too long: drop the lost time
+
+    def step(self):
+        """Run one tick with the queued inputs and publish the result."""
+        sim = self.sim
+        inputs = []
+        queue = self.inputs
+        while queue:
+            item = queue.popleft()
+            if callable(item):
+                item(sim)
+            else:
+                inputs.append(item)
+        if inputs:
+            # Held keys queue a press per key repeat; the tick applies them
+            # coalesced, and only that is recorded
+            inputs = coalesce_inputs(inputs)
+            if self.recorder is not None:
+                for action in inputs:
+                    self.recorder.record(sim.tick, action)
+        self.before[:] = sim.rects
+        climbed = sim.rows_climbed
+        sim.step(inputs)
+        if sim.rows_climbed != climbed:
+            # The rows were recycled: the new layout is drawn without blending from the old one
+            self.before[:] = sim.rects
+        self.publish()
+
+    def publish(self):
+        sim = self.sim
+        back = 1 - self.front
+        buffer = self.buffers[back]
+        buffer.seq += 1
+        buffer.prev_rects[:] = self.before
+        buffer.rects[:] = sim.rects
+        count = len(sim.balls)
+        buffer.balls[:count] = array("i", sim.balls)
+        buffer.ball_count = count
+        buffer.score = sim.score
+        buffer.outcome = sim.outcome
+        buffer.tick = sim.tick
+        buffer.time = time.perf_counter()
+        buffer.seq += 1
+        self.front = back
+
+    def latest(self, state):
+        """Copy the most recently published tick into state and return it."""
+        while True:
+            buffer = self.buffers[self.front]
+            seq = buffer.seq
+            if seq & 1 == 0:
+                state.copy_from(buffer)
+                if buffer.seq == seq:
+                    return state
+            time.sleep(0)  # Let the writer finish rather than spinning on the GIL
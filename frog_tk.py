@@ -0,0 +1,297 @@
+"""Tk frontend for the Frog Jump games.
+
+FrogJumpGame owns the window and key bindings. The frog_sim.Simulation
+runs on a frog_thread.SimulationThread at a fixed tick rate, and the Tk
+thread only draws the latest tick it published.
+"""
+import random
+import time
+import tkinter as tk
+from array import array
+
+from frog_profile import PhaseProfiler
+from frog_replay import Recorder
+from frog_sim import DOWN, JUMP, LEFT, RIGHT, WIN, Simulation
+from frog_thread import SimulationThread, StateBuffer
+from frog_trace import Tracer
+
+
+class FrogJumpGame:
+    def __init__(self, root, config=None, seed=None, record_to=None, trace_to=None, profile_to=None):
+        self.root = root
+        self.root.title("Frog Jump Game")
+        if seed is None:
+            seed = random.randrange(2 ** 32)  # Always known, so the run can be recorded
+        self.trace_to = trace_to
+        self.profiler = PhaseProfiler()
+        self.sim = Simulation(config, seed, Tracer() if trace_to else None, self.profiler)
+        self.config = cfg = self.sim.config
+
+        # Optional input recording, trace and profile, saved when the game ends or the window closes
+        self.record_to = record_to
+        self.recorder = Recorder(cfg, seed) if record_to else None
+        self.profile_to = profile_to
+        if record_to or trace_to or profile_to:
+            self.root.protocol("WM_DELETE_WINDOW", self.close)
+
+        # Canvas setup
+        self.canvas = tk.Canvas(root, width=cfg.window_width, height=cfg.window_height, bg="#faf0e6")
+        self.canvas.pack()
+
+        # One canvas item per simulated entity slot
+        sim = self.sim
+        # Logs carry a tag per row so a row moving as one can be moved in one command
+        self.log_items = [self.canvas.create_rectangle(*sim.rect(slot), fill="brown",
+                                                       tags=f"row{sim.log_position(slot)[0]}")
+                          for slot in range(sim.num_logs)]
+        self.knight_item = self.canvas.create_rectangle(*sim.rect(sim.knight), fill="gray", outline="black")
+        self.chest_item = self.canvas.create_rectangle(*sim.rect(sim.chest), fill="yellow")
+        # Ball pool: one hidden oval per ball slot, shown while the slot is in play
+        self.ball_items = [self.canvas.create_oval(*sim.rect(sim.first_ball + index), fill=cfg.ball_color,
+                                                   state="hidden")
+                           for index in range(cfg.max_balls)]
+        self.ball_shown = [False] * cfg.max_balls
+        self.score_text = self.canvas.create_text(cfg.window_width - 50, 20, text="Score: 0",
+                                                  font=("Arial", 14), fill="black")
+        self.score_shown = 0
+
+        # Performance HUD, toggled with F3
+        self.hud_text = self.canvas.create_text(10, 10, anchor="nw", text="", font=("Courier", 10),
+                                                fill="blue", state="hidden")
+        self.hud_visible = False
+        self.frames = 0
+
+        # Coordinates last sent to Tk per slot, so render() only touches what changed
+        self.canvas_path = str(self.canvas)
+        self.drawn = array("d", sim.rects)
+
+        # Key bindings
+        self.root.bind("<Up>", lambda event: self.handle_input(JUMP))  # Jump with Up arrow or space
+        self.root.bind("<Left>", lambda event: self.handle_input(LEFT))  # Move left with Left arrow
+        self.root.bind("<Right>", lambda event: self.handle_input(RIGHT))  # Move right with Right arrow
+        self.root.bind("<space>", lambda event: self.handle_input(JUMP))  # Spacebar jump (same as Up)
+        if cfg.fall_mode is not None:
+            self.root.bind("<Down>", lambda event: self.handle_input(DOWN))  # Down arrow to fall
+        self.root.bind("<F3>", lambda event: self.toggle_hud())
+        self.root.bind("<F5>", lambda event: self.quick_save())
+        self.root.bind("<F9>", lambda event: self.quick_load())
+        self.saved_state = None
+
+        # Physics runs on its own thread from here on; the canvas is drawn
+        # from a private copy of the last tick it published
+        self.runner = SimulationThread(sim, self.recorder)
+        self.state = StateBuffer(sim)
+        self.runner.start()
+
+        # Start drawing
+        self.update_game()
+
+    def handle_input(self, action):
+        """Queue a key press for the next tick."""
+        self.runner.send(action)
+
+    def update_game(self):
+        """Draw loop: redraw from the latest tick the simulation thread published.
+
+        No physics runs here, so a slow frame or a stalled Tk only delays
+        drawing; the next frame shows wherever the game has got to.
+        """
+        cfg = self.config
+        state = self.runner.latest(self.state)
+        if state.outcome is not None:
+            self.render(1.0)
+            self.show_outcome()
+            return
+        self.render(min((time.perf_counter() - state.time) * 1000 / cfg.tick_ms, 1.0))
+        self.root.after(cfg.render_ms, self.update_game)
+
+    def lerp(self, slot, alpha):
+        """Coordinates of a slot blended between the last two ticks.
+
+        Anything that moved further than half a row in one tick (a jump, a
+        new chest, a respawned ball) is drawn where it is now.
+        """
+        cur = self.state.rects
+        prev = self.state.prev_rects
+        i = 4 * slot
+        dx = cur[i] - prev[i]
+        dy = cur[i + 1] - prev[i + 1]
+        snap = self.config.jump_distance / 2
+        if abs(dx) > snap or abs(dy) > snap:
+            return cur[i], cur[i + 1], cur[i + 2], cur[i + 3]
+        back = 1.0 - alpha
+        dx *= back
+        dy *= back
+        return cur[i] - dx, cur[i + 1] - dy, cur[i + 2] - dx, cur[i + 3] - dy
+
+    def render(self, alpha):
+        """Copy the simulation state onto the canvas.
+
+        This is the only place the canvas is written to, and it never reads
+        coordinates back. alpha is how far real time has moved past the last
+        tick, as a fraction of a tick.
+
+        The frame is built as one Tcl script and sent with a single eval,
+        items whose coordinates match what was last drawn are left alone,
+        and text is only reconfigured when it changes; that is where the
+        time goes down. A row whose logs all shifted by the same amount is
+        moved through its row tag in one command, but in most variants each
+        log has its own speed, so that seldom happens.
+        """
+        sim = self.sim  # Only its slot numbers; the state drawn is self.state
+        state = self.state
+        cfg = self.config
+        path = self.canvas_path
+        drawn = self.drawn
+        lerp = self.lerp
+        script = []
+        add = self.profiler.add
+        clock = time.perf_counter_ns
+        start = clock()
+        per_row = cfg.num_logs_per_row
+        for row in range(cfg.num_rows):
+            first = row * per_row
+            moved = []
+            for slot in range(first, first + per_row):
+                rect = lerp(slot, alpha)
+                if self.changed(slot, rect):
+                    moved.append((slot, rect))
+            if not moved:
+                continue
+            slot, rect = moved[0]
+            dx = rect[0] - drawn[4 * slot]
+            dy = rect[1] - drawn[4 * slot + 1]
+            if len(moved) == per_row > 1 and all(self.shifted_by(slot, rect, dx, dy) for slot, rect in moved):
+                script.append(f"{path} move row{row} {dx!r} {dy!r}")
+                for slot, _ in moved:
+                    i = 4 * slot
+                    drawn[i] += dx
+                    drawn[i + 1] += dy
+                    drawn[i + 2] += dx
+                    drawn[i + 3] += dy
+            else:
+                for slot, rect in moved:
+                    self.draw(script, self.log_items[slot], slot, rect)
+        now = clock()
+        add("render.logs", now - start)
+
+        start = now
+        rect = lerp(sim.knight, alpha)
+        if self.changed(sim.knight, rect):
+            self.draw(script, self.knight_item, sim.knight, rect)
+        i = 4 * sim.chest
+        rect = state.rects[i:i + 4]
+        if self.changed(sim.chest, rect):
+            self.draw(script, self.chest_item, sim.chest, rect)
+        now = clock()
+        add("render.knight", now - start)
+
+        # Show the pooled ovals of balls in play and hide the rest; items
+        # are only reconfigured when their slot changes state
+        start = now
+        shown = self.ball_shown
+        in_play = [False] * len(shown)
+        for ball in state.balls[:state.ball_count]:
+            index = ball - sim.first_ball
+            in_play[index] = True
+            rect = lerp(ball, alpha)
+            if self.changed(ball, rect):
+                self.draw(script, self.ball_items[index], ball, rect)
+        for index, playing in enumerate(in_play):
+            if playing != shown[index]:
+                shown[index] = playing
+                script.append(f"{path} itemconfigure {self.ball_items[index]} "
+                              f"-state {'normal' if playing else 'hidden'}")
+        now = clock()
+        add("render.balls", now - start)
+
+        start = now
+        if state.score != self.score_shown:
+            self.score_shown = state.score
+            script.append(f"{path} itemconfigure {self.score_text} -text {{Score: {state.score}}}")
+        self.frames += 1
+        if self.hud_visible and self.frames % 15 == 0:
+            hud = "\n".join(self.profiler.report_lines())
+            script.append(f"{path} itemconfigure {self.hud_text} -text {{{hud}}}")
+        now = clock()
+        add("render.text", now - start)
+
+        start = now
+        if script:
+            self.canvas.tk.eval("\n".join(script))
+        add("render.tcl", clock() - start)
+
+    def changed(self, slot, rect):
+        """Whether rect differs from what was last drawn for slot."""
+        drawn = self.drawn
+        i = 4 * slot
+        return (rect[0] != drawn[i] or rect[1] != drawn[i + 1]
+                or rect[2] != drawn[i + 2] or rect[3] != drawn[i + 3])
+
+    def shifted_by(self, slot, rect, dx, dy):
+        """Whether rect is the last drawn rect of slot moved by exactly (dx, dy)."""
+        drawn = self.drawn
+        i = 4 * slot
+        return (rect[0] - drawn[i] == dx and rect[1] - drawn[i + 1] == dy
+                and rect[2] - drawn[i + 2] == dx and rect[3] - drawn[i + 3] == dy)
+
+    def draw(self, script, item, slot, rect):
+        """Queue a coords command for item and remember what was drawn."""
+        x1, y1, x2, y2 = rect
+        script.append(f"{self.canvas_path} coords {item} {x1!r} {y1!r} {x2!r} {y2!r}")
+        i = 4 * slot
+        self.drawn[i], self.drawn[i + 1], self.drawn[i + 2], self.drawn[i + 3] = x1, y1, x2, y2
+
+    def quick_save(self):
+        self.runner.send(self.save_state)
+
+    def save_state(self, sim):
+        """Runs on the simulation thread between ticks."""
+        self.saved_state = sim.snapshot()
+
+    def quick_load(self):
+        """Go back to the quick save; the canvas items are simply redrawn.
+
+        Not available while recording, since a recording cannot rewind.
+        """
+        saved = self.saved_state
+        if saved is not None and not self.recorder:
+            self.runner.send(lambda sim: sim.restore(saved))
+
+    def toggle_hud(self):
+        self.hud_visible = not self.hud_visible
+        self.canvas.itemconfig(self.hud_text, state="normal" if self.hud_visible else "hidden",
+                               text="\n".join(self.profiler.report_lines()))
+
+    def close(self):
+        self.runner.stop()
+        self.save_logs()
+        self.root.destroy()
+
+    def save_logs(self):
+        """Write out the input recording, trace and profile, if they are on."""
+        if self.recorder:
+            self.recorder.save(self.record_to, self.sim)
+        if self.sim.tracer is not None and self.sim.tracer.count:
+            self.sim.tracer.flush(self.trace_to)
+        if self.profile_to:
+            self.profiler.export(self.profile_to)
+
+    def show_outcome(self):
+        self.runner.stop()
+        self.save_logs()
+        cfg = self.config
+        if self.sim.outcome == WIN:
+            self.canvas.create_text(cfg.window_width // 2, cfg.window_height // 2, text="You Win!",
+                                    font=("Arial", 24), fill="green")
+        elif cfg.endless:
+            self.canvas.create_text(cfg.window_width // 2, cfg.window_height // 2,
+                                    text=f"Game Over! Climbed {self.sim.rows_climbed} rows",
+                                    font=("Arial", 20), fill="red")
+        elif cfg.show_final_score:
+            self.canvas.create_text(cfg.window_width // 2, cfg.window_height // 2,
+                                    text="Game Over! Final Score: " + str(self.sim.score),
+                                    font=("Arial", 20), fill="red")
+        else:
+            self.canvas.create_text(cfg.window_width // 2, cfg.window_height // 2, text="Game Over!",
+                                    font=("Arial", 24), fill="red")
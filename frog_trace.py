@@ -0,0 +1,103 @@
+"""Low-overhead structured tracing for the simulation.
+
+A Tracer keeps the most recent events in a preallocated ring buffer of
+fixed-size records: tick, event kind, two entity slots and a rectangle,
+stored as doubles in one array('d'). Recording an event is a handful of
+item assignments with no allocation and no I/O; when tracing is off the
+simulation only tests ``self.tracer`` for None. The buffer is written to
+disk in one go with flush(), e.g. when the game ends; the first flush of
+a Tracer replaces the file and later ones append to it.
+
+Usage:
+    python frog_trace.py trace.bin
+"""
+import sys
+from array import array
+
+# Event kinds
+LAND = 1  # Knight standing on a log: a = knight, b = log
+LOG_HIT = 2  # Two logs in a row touching: a, b = logs
+CHEST = 3  # Knight picked up the chest: a = knight, b = chest
+BALL_HIT = 4  # Ball hit the knight: a = knight, b = ball
+GAME_OVER = 5  # Game ended: a = knight, b = 1 for a win, 0 for a loss
+
+KIND_NAMES = {LAND: "land", LOG_HIT: "log_hit", CHEST: "chest", BALL_HIT: "ball_hit", GAME_OVER: "game_over"}
+
+RECORD_SIZE = 8  # tick, kind, a, b, x1, y1, x2, y2
+
+
+class Tracer:
+    """Ring buffer holding the last ``capacity`` trace events."""
+
+    def __init__(self, capacity=65536):
+        self.capacity = capacity
+        self.buffer = array("d", bytes(8 * RECORD_SIZE * capacity))
+        self.head = 0  # Next record to write
+        self.count = 0  # Records held, at most capacity
+        self.flushed = False  # Whether this session has written its file yet
+
+    def next_record(self):
+        """Claim the next record and return its offset in the buffer."""
+        i = self.head * RECORD_SIZE
+        self.head += 1
+        if self.head == self.capacity:
+            self.head = 0
+        if self.count < self.capacity:
+            self.count += 1
+        return i
+
+    def emit_slot(self, tick, kind, a, b, rects):
+        """Record an event with the rectangle of slot a in a Simulation's store."""
+        buffer = self.buffer
+        i = self.next_record()
+        j = 4 * a
+        buffer[i] = tick
+        buffer[i + 1] = kind
+        buffer[i + 2] = a
+        buffer[i + 3] = b
+        buffer[i + 4] = rects[j]
+        buffer[i + 5] = rects[j + 1]
+        buffer[i + 6] = rects[j + 2]
+        buffer[i + 7] = rects[j + 3]
+
+    def records(self):
+        """The held records, oldest first, as one array('d')."""
+        start = (self.head - self.count) % self.capacity
+        end = start + self.count
+        if end <= self.capacity:
+            return self.buffer[start * RECORD_SIZE:end * RECORD_SIZE]
+        return self.buffer[start * RECORD_SIZE:] + self.buffer[:self.head * RECORD_SIZE]
+
+    def flush(self, path):
+        """Write the held records to a file in one go and empty the buffer.
+
+        The first flush truncates the file, so a new session does not add
+        to an old trace; later flushes append.
+        """
+        with open(path, "ab" if self.flushed else "wb") as out:
+            self.records().tofile(out)
+        self.flushed = True
+        self.head = self.count = 0
+
+
+def read_trace(path):
+    """Yield (tick, kind, a, b, (x1, y1, x2, y2)) tuples from a trace file."""
+    data = array("d")
+    with open(path, "rb") as trace:
+        data.frombytes(trace.read())
+    for i in range(0, len(data), RECORD_SIZE):
+        yield (int(data[i]), int(data[i + 1]), int(data[i + 2]), int(data[i + 3]),
+               tuple(data[i + 4:i + 8]))
+
+
+def main():
+    if len(sys.argv) != 2:
+        print("usage: python frog_trace.py TRACE")
+        sys.exit(2)
+    for tick, kind, a, b, rect in read_trace(sys.argv[1]):
+        coords = ", ".join(f"{value:g}" for value in rect)
+        print(f"{tick:>8} {KIND_NAMES.get(kind, kind):<9} {a:>4} {b:>4}  [{coords}]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+"""Monte Carlo difficulty tuner for the Frog Jump tuning constants.
+
+Sweeps a grid or a random sample of GameConfig values, plays many seeded
+headless games per point with a scripted policy, and reports win rate,
+time to win and chest rate. Games are spread over a process pool in small
+chunks so the sweep scales with the number of cores. Every finished point
+is appended to a JSON-lines results file, and points already in that file
+are skipped, so an interrupted sweep picks up where it stopped.
+
+Examples:
+    python frog_tune.py --variant game --grid initial_log_speed=4,5,6 --grid gravity=0.4,0.5
+    python frog_tune.py --variant quantumquest --samples 40 --range max_balls=1:8 --range gravity=0.3:0.8
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from frog_bot import planner_policy
+from frog_sim import JUMP, LEFT, RIGHT, WIN, Simulation
+from frog_variants import VARIANTS, variant_config
+
+# Constants the tuner is meant to sweep
+TUNABLE = ("initial_log_speed", "gravity", "max_fall_velocity", "bounce_velocity", "max_balls", "jump_distance")
+
+
+def idle_policy(sim, rng):
+    """Never press anything."""
+    return ()
+
+
+def random_policy(sim, rng):
+    """Mash keys: mostly wait, sometimes step or jump."""
+    roll = rng.random()
+    if roll < 0.05:
+        return (JUMP,)
+    if roll < 0.10:
+        return (LEFT,)
+    if roll < 0.15:
+        return (RIGHT,)
+    return ()
+
+
+def hopper_policy(sim, rng):
+    """Jump when a log in the row above is over the knight, else stay centred on the current log."""
+    cfg = sim.config
+    rects = sim.rects
+    k = 4 * sim.knight
+    kx1, kx2 = rects[k], rects[k + 2]
+    if rects[k + 1] - cfg.jump_distance <= 0:
+        return (JUMP,)  # One more jump wins
+    if not sim.on_log:
+        return ()
+    row = cfg.row_at(rects[k + 3])
+    if row + 1 >= cfg.num_rows:
+        return (JUMP,)
+    for col in range(cfg.num_logs_per_row):
+        log = 4 * sim.log_slot(row + 1, col)
+        if rects[log] <= kx1 and rects[log + 2] >= kx2:
+            return (JUMP,)
+    for col in range(cfg.num_logs_per_row):
+        log = 4 * sim.log_slot(row, col)
+        if rects[log] <= kx2 and rects[log + 2] >= kx1:
+            offset = (rects[log] + rects[log + 2] - kx1 - kx2) / 2
+            if offset > cfg.move_step:
+                return (RIGHT,)
+            if offset < -cfg.move_step:
+                return (LEFT,)
+            break
+    return ()
+
+
+POLICIES = {"idle": idle_policy, "random": random_policy, "hopper": hopper_policy, "planner": planner_policy}
+
+
+def run_chunk(variant, params, policy_name, seeds, max_ticks):
+    """Play one game per seed and return the summed statistics."""
+    cfg = variant_config(variant, **params)
+    policy = POLICIES[policy_name]
+    stats = {"games": 0, "wins": 0, "ticks_to_win": 0, "chests": 0, "ticks": 0}
+    for seed in seeds:
+        sim = Simulation(cfg, seed)
+        rng = random.Random(seed)
+        while sim.outcome is None and sim.tick < max_ticks:
+            sim.step(policy(sim, rng))
+        stats["games"] += 1
+        stats["chests"] += sim.chests_collected
+        stats["ticks"] += sim.tick
+        if sim.outcome == WIN:
+            stats["wins"] += 1
+            stats["ticks_to_win"] += sim.tick
+    return stats
+
+
+def parse_value(text):
+    if text.lower() == "none":
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def parse_assignment(text, parser):
+    name, sep, values = text.partition("=")
+    if not sep or name not in TUNABLE:
+        parser.error(f"expected NAME=VALUES with NAME one of {', '.join(TUNABLE)}, got {text!r}")
+    return name, values
+
+
+def build_points(args, parser):
+    """The list of parameter dicts to evaluate, in a stable order."""
+    if args.samples:
+        ranges = {}
+        for text in args.range:
+            name, values = parse_assignment(text, parser)
+            lo, _, hi = values.partition(":")
+            ranges[name] = (parse_value(lo), parse_value(hi))
+        rng = random.Random(args.seed)
+        points = []
+        for _ in range(args.samples):
+            point = {}
+            for name, (lo, hi) in sorted(ranges.items()):
+                if isinstance(lo, int) and isinstance(hi, int):
+                    point[name] = rng.randint(lo, hi)
+                else:
+                    point[name] = round(rng.uniform(lo, hi), 4)
+            points.append(point)
+        return points
+
+    names, choices = [], []
+    for text in args.grid:
+        name, values = parse_assignment(text, parser)
+        names.append(name)
+        choices.append([parse_value(value) for value in values.split(",")])
+    return [dict(zip(names, combo)) for combo in itertools.product(*choices)]
+
+
+def check_point(args, params):
+    """Why the policy cannot play a point, or None if it can."""
+    try:
+        POLICIES[args.policy](Simulation(variant_config(args.variant, **params), args.seed),
+                              random.Random(args.seed))
+    except ValueError as error:
+        return str(error)
+    return None
+
+
+def point_key(args, params):
+    return json.dumps({"variant": args.variant, "policy": args.policy, "games": args.games,
+                       "max_ticks": args.max_ticks, "seed": args.seed, "params": params}, sort_keys=True)
+
+
+def load_done(path):
+    """Keys of the points already in the results file."""
+    done = set()
+    if os.path.exists(path):
+        with open(path) as results:
+            for line in results:
+                if line.strip():
+                    done.add(json.loads(line)["key"])
+    return done
+
+
+def summarize(params, stats, tick_ms):
+    wins = stats["wins"]
+    minutes = stats["ticks"] * tick_ms / 60000
+    return {
+        "params": params,
+        "games": stats["games"],
+        "win_rate": wins / stats["games"],
+        "mean_ticks_to_win": stats["ticks_to_win"] / wins if wins else None,
+        "chests_per_minute": stats["chests"] / minutes if minutes else 0.0,
+    }
+
+
+def format_summary(summary):
+    params = " ".join(f"{name}={value}" for name, value in summary["params"].items())
+    ticks = summary["mean_ticks_to_win"]
+    ticks = "-" if ticks is None else f"{ticks:.0f}"
+    return (f"{params or '(defaults)'}: win rate {summary['win_rate']:.1%}, "
+            f"ticks to win {ticks}, chests/min {summary['chests_per_minute']:.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep Frog Jump tuning constants with headless games.")
+    parser.add_argument("--variant", default="game", choices=sorted(VARIANTS))
+    parser.add_argument("--policy", default="hopper", choices=sorted(POLICIES))
+    parser.add_argument("--grid", action="append", default=[], metavar="NAME=V1,V2,...",
+                        help="values to try for one constant; repeat to build a grid")
+    parser.add_argument("--samples", type=int, default=0, help="draw this many random points instead of a grid")
+    parser.add_argument("--range", action="append", default=[], metavar="NAME=LO:HI",
+                        help="sampling range for one constant, used with --samples")
+    parser.add_argument("--games", type=int, default=200, help="games per point")
+    parser.add_argument("--max-ticks", type=int, default=3000, help="ticks before a game counts as unfinished")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk", type=int, default=25, help="games per worker task")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--results", default="tune_results.jsonl")
+    args = parser.parse_args()
+
+    done = load_done(args.results)
+    points = [params for params in build_points(args, parser) if point_key(args, params) not in done]
+    # Fail here rather than in a worker once the sweep is under way
+    for params in points:
+        problem = check_point(args, params)
+        if problem:
+            params = " ".join(f"{name}={value}" for name, value in params.items()) or "(defaults)"
+            parser.error(f"--policy {args.policy} cannot play {args.variant} with {params}: {problem}")
+    if not points:
+        print("Nothing to do: every point is already in", args.results)
+        return
+    tick_ms = variant_config(args.variant).tick_ms
+    seeds = list(range(args.seed, args.seed + args.games))
+
+    futures = {}
+    remaining = {}
+    totals = {}
+    summaries = []
+    with ProcessPoolExecutor(max_workers=args.workers) as pool, open(args.results, "a") as results:
+        for index, params in enumerate(points):
+            remaining[index] = 0
+            for start in range(0, len(seeds), args.chunk):
+                chunk = seeds[start:start + args.chunk]
+                future = pool.submit(run_chunk, args.variant, params, args.policy, chunk, args.max_ticks)
+                futures[future] = index
+                remaining[index] += 1
+
+        for future in as_completed(futures):
+            index = futures[future]
+            stats = future.result()
+            total = totals.setdefault(index, dict.fromkeys(stats, 0))
+            for name, value in stats.items():
+                total[name] += value
+            remaining[index] -= 1
+            if remaining[index]:
+                continue
+
+            # Point finished: record it right away so a rerun can skip it
+            params = points[index]
+            summary = summarize(params, total, tick_ms)
+            summaries.append(summary)
+            results.write(json.dumps({"key": point_key(args, params), **summary}) + "\n")
+            results.flush()
+            print(format_summary(summary), flush=True)
+
+    print("\nBest points by win rate:")
+    for summary in sorted(summaries, key=lambda item: item["win_rate"], reverse=True)[:10]:
+        print(format_summary(summary))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Settings for each Frog Jump variant, keyed by the script that plays it.
+
+Every value that is not the frog_sim default is spelled out here, so the
+variants can be compared side by side and loaded by headless tools
+without opening a window.
+"""
+from frog_sim import GameConfig
+
+VARIANTS = {
+    # game.py: evenly spaced logs with random speeds that bounce off each
+    # other; Down makes the knight sink through its log
+    "game": dict(
+        initial_log_speed=6, speed_increment=0.3, gravity=0.5, max_fall_velocity=10,
+        jump_distance=100, num_logs_per_row=3,
+        log_layout="spaced", log_speed_mode="uniform", knight_start_x=150,
+        log_collisions=True, fall_mode="fast",
+    ),
+    # Quantumquest.py: logs in fixed columns; black balls drip off the logs
+    # and cost points. The knight does not ride its log, and Down drops it to
+    # the row below.
+    "quantumquest": dict(
+        initial_log_speed=5, speed_increment=0.3, gravity=0.5, max_fall_velocity=None,
+        jump_distance=100, num_logs_per_row=3,
+        max_balls=3, ball_mode="drip", ball_speed=5, ball_color="black",
+        log_layout="columns", log_speed_mode="sign", knight_start_x=185,
+        carry_factor=0, gravity_on_move=True, fall_mode="next_row",
+    ),
+    # gravity quest.py: logs in fixed columns, capped fall speed; Down warps
+    # the knight onto a random log
+    "gravity_quest": dict(
+        initial_log_speed=5, speed_increment=0.5, gravity=0.5, max_fall_velocity=15,
+        jump_distance=100, num_logs_per_row=3,
+        log_layout="columns", log_speed_mode="sign", knight_start_x=150,
+        gravity_on_move=True, fall_mode="random_log",
+    ),
+    # play play lol.py: the knight rides the first log until it jumps off;
+    # red balls rain from the sky every 3 seconds and the chest is checked
+    # every tick. Runs at 50 ticks a second.
+    "play_play_lol": dict(
+        initial_log_speed=5, speed_increment=0.3, gravity=0.5, max_fall_velocity=None,
+        jump_distance=100, num_logs_per_row=3,
+        max_balls=3, ball_mode="rain", ball_speed=10, ball_spawn_interval=3000 // 20, ball_color="red",
+        log_layout="columns", log_speed_mode="sign", knight_start_x=185,
+        anchor_knight=True, jump_mode="launch", fall_mode="drop",
+        move_checks=False, chest_every_tick=True,
+        fall_limit=800 - 30, tick_ms=20, show_final_score=True,
+    ),
+    # import tkinter as tk.py: two logs per row hugging the walls; the
+    # knight bounces whenever it lands
+    "import_tkinter_as_tk": dict(
+        initial_log_speed=4, speed_increment=0.3, gravity=0.5, max_fall_velocity=None,
+        bounce_velocity=-8, jump_distance=100, num_logs_per_row=2,
+        log_layout="edges", log_speed_mode="sign", knight_start_x=185,
+        gravity_on_move=True, fall_mode=None,
+    ),
+}
+VARIANTS["experimet"] = VARIANTS["game"]  # experimet.py is a copy of game.py
+# endless.py: game.py as an endless climb, with logs getting faster by
+# speed_increment for every row climbed
+VARIANTS["endless"] = dict(VARIANTS["game"], endless=True)
+
+
+def variant_config(name, **overrides):
+    """Build the GameConfig of a variant, with any settings replaced."""
+    if name not in VARIANTS:
+        raise KeyError(f"Unknown variant: {name} (choose from {', '.join(sorted(VARIANTS))})")
+    return GameConfig(**{**VARIANTS[name], **overrides})
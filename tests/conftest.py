@@ -0,0 +1,25 @@
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# The game modules sit at the top of the repository, not in a package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from frog_tune import random_policy  # noqa: E402
+from frog_variants import VARIANTS  # noqa: E402
+
+# experimet plays exactly like game
+ALL_VARIANTS = sorted(name for name in VARIANTS if name != "experimet")
+
+
+@pytest.fixture(params=ALL_VARIANTS)
+def variant(request):
+    return request.param
+
+
+def scripted_inputs(seed, ticks):
+    """A fixed list of per-tick inputs from the random policy."""
+    rng = random.Random(seed)
+    return [random_policy(None, rng) for _ in range(ticks)]
@@ -0,0 +1,85 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from frog_batch import LOST, NOOP, PLAYING, WON, BatchSimulation  # noqa: E402
+from frog_sim import JUMP, LEFT, RIGHT, Simulation  # noqa: E402
+from frog_variants import variant_config  # noqa: E402
+
+# Variants BatchSimulation follows; endless scrolls, which it does not do
+BATCH_VARIANTS = ["game", "quantumquest", "gravity_quest", "play_play_lol", "import_tkinter_as_tk"]
+
+
+def copy_into(batch, game, sim):
+    """Give one game of the batch the state of a Simulation."""
+    cfg = sim.config
+    shape = (cfg.num_rows, cfg.num_logs_per_row)
+    batch.log_x[game] = np.array(sim.rects[0:4 * sim.num_logs:4]).reshape(shape)
+    batch.log_speed[game] = np.array(sim.log_speeds).reshape(shape)
+    k = 4 * sim.knight
+    c = 4 * sim.chest
+    batch.knight_x[game], batch.knight_y[game] = sim.rects[k], sim.rects[k + 1]
+    batch.chest_x[game], batch.chest_y[game] = sim.rects[c], sim.rects[c + 1]
+
+
+@pytest.mark.parametrize("name", BATCH_VARIANTS)
+def test_knight_follows_the_same_path_as_simulation(name):
+    # No balls and no chest pick-ups, whose placement draws from different RNGs
+    config = variant_config(name, max_balls=0, chest_reward=0)
+    sim = Simulation(config, 8)
+    sim.set_rect(sim.chest, -1000, -1000, 30, 30)
+    batch = BatchSimulation(2, config, 8)
+    copy_into(batch, 0, sim)
+    batch.chest_x[0] = batch.chest_y[0] = -1000
+    rng = random.Random(8)
+    k = 4 * sim.knight
+    for _ in range(300):
+        action = rng.choice([NOOP] * 12 + [LEFT, RIGHT, JUMP])
+        sim.step([] if action == NOOP else [action])
+        _, outcome = batch.step([action, NOOP])
+        if sim.outcome is not None:
+            assert outcome[0] == {"win": WON, "lose": LOST}[sim.outcome]
+            break
+        assert outcome[0] == PLAYING
+        assert batch.knight_x[0] == pytest.approx(sim.rects[k], abs=1e-6)
+        assert batch.knight_y[0] == pytest.approx(sim.rects[k + 1], abs=1e-6)
+
+
+def test_fast_fall_stops_at_the_first_log():
+    config = variant_config("quantumquest", max_balls=0)
+    batch = BatchSimulation(2, config, 1)
+    batch.log_speed[:] = 0
+    batch.knight_x[0] = batch.log_x[0, 5, 0] + 10
+    batch.knight_y[0] = config.row_y(5) - 40 - config.knight_height
+    batch.velocity_y[0] = 249.5
+    batch.step([NOOP, NOOP])
+    assert batch.knight_y[0] + config.knight_height == config.row_y(5)
+
+
+def test_fast_ball_hits_the_knight_it_passes():
+    config = variant_config("quantumquest", ball_speed=90, ball_spawn_chance=0)
+    batch = BatchSimulation(2, config, 1)
+    batch.log_speed[:] = 0
+    batch.ball_x[0, 0] = batch.knight_x[0] + 10
+    batch.ball_y[0, 0] = batch.knight_y[0] - 50
+    batch.ball_active[0, 0] = True
+    batch.step([NOOP, NOOP])
+    assert batch.score[0] == -config.ball_penalty
+    assert not batch.ball_active[0].any()
+
+
+def test_finished_games_are_reset():
+    batch = BatchSimulation(50, variant_config("game"), 1)
+    outcomes = []
+    for _ in range(200):
+        _, outcome = batch.step(np.full(50, NOOP))
+        outcomes.append(outcome)
+    assert (np.array(outcomes) == LOST).any()
+    assert (batch.ticks < 200).any()
+
+
+def test_endless_is_refused():
+    with pytest.raises(ValueError):
+        BatchSimulation(10, variant_config("endless"))
@@ -0,0 +1,45 @@
+import pytest
+
+from frog_bot import Planner
+from frog_sim import WIN, Simulation
+from frog_variants import variant_config
+
+
+@pytest.mark.parametrize("name", ["game", "quantumquest", "endless"])
+def test_predicted_logs_match_the_game(name):
+    # game and endless have logs hitting each other, which the prediction must foresee
+    sim = Simulation(variant_config(name), 3)
+    planner = Planner(sim)
+    planner.seed_logs()
+    rows = sim.config.num_rows
+    per_row = sim.config.num_logs_per_row
+    for tick in range(1, 300):
+        sim.move_logs()
+        if sim.config.log_collisions:
+            sim.handle_all_log_collisions()
+        sim.tick = tick
+        for row in range(rows):
+            for col, (x1, _, _, speed) in enumerate(planner.logs_at(tick, row)):
+                slot = row * per_row + col
+                assert x1 == sim.rects[4 * slot]
+                assert speed == sim.log_speeds[slot]
+
+
+@pytest.mark.parametrize("name", ["game", "quantumquest", "gravity_quest"])
+def test_planner_wins_most_seeded_games(name):
+    wins = 0
+    for seed in range(5):
+        sim = Simulation(variant_config(name), seed)
+        planner = Planner(sim, time_limit_ns=None)  # No time limit, so the moves do not depend on the machine
+        while sim.outcome is None and sim.tick < 2000:
+            sim.step(planner.decide())
+        wins += sim.outcome == WIN and sim.chests_collected >= 1
+    assert wins >= 4
+
+
+@pytest.mark.parametrize("name,overrides", [
+    ("play_play_lol", {}), ("import_tkinter_as_tk", {}), ("game", {"bounce_velocity": -5}),
+])
+def test_planner_refuses_what_it_cannot_model(name, overrides):
+    with pytest.raises(ValueError):
+        Planner(Simulation(variant_config(name, **overrides), 0))
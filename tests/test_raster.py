@@ -0,0 +1,27 @@
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from frog_raster import FrameRenderer  # noqa: E402
+from frog_sim import Simulation  # noqa: E402
+from frog_tune import random_policy  # noqa: E402
+from frog_variants import variant_config  # noqa: E402
+
+
+@pytest.mark.parametrize("scale", [1.0, 0.25])
+def test_incremental_frames_match_a_full_redraw(variant, scale):
+    sim = Simulation(variant_config(variant), 6)
+    renderer = FrameRenderer(sim, scale)
+    full = FrameRenderer(sim, scale)
+    rng = random.Random(6)
+    for tick in range(150):
+        if sim.outcome is None:
+            sim.step(random_policy(sim, rng))
+        frame = bytes(renderer.render())
+        if tick % 10 == 0 or sim.outcome is not None:
+            full.reset(sim)  # Draws everything from scratch
+            assert frame == bytes(full.frame)
+        if sim.outcome is not None:
+            break
@@ -0,0 +1,41 @@
+import random
+
+from frog_replay import Recorder, Recording, replay, replay_ticks
+from frog_sim import Simulation, coalesce_inputs
+from frog_tune import hopper_policy, random_policy
+from frog_variants import variant_config
+
+
+def record(config, seed, policy, max_ticks=2000):
+    """Play a game with a policy, recording it the way the Tk game does."""
+    sim = Simulation(config, seed)
+    recorder = Recorder(config, seed)
+    rng = random.Random(seed)
+    while sim.outcome is None and sim.tick < max_ticks:
+        inputs = coalesce_inputs(list(policy(sim, rng)))
+        for action in inputs:
+            recorder.record(sim.tick, action)
+        sim.step(inputs)
+    return sim, recorder.finish(sim)
+
+
+def test_replay_is_bit_exact(variant):
+    for policy in (random_policy, hopper_policy):
+        sim, data = record(variant_config(variant), 11, policy)
+        recording = Recording(data)
+        replayed = replay(recording)
+        assert replayed.rects == sim.rects
+        assert (replayed.tick, replayed.score, replayed.outcome) == (sim.tick, sim.score, sim.outcome)
+        assert (recording.final_tick, recording.score, recording.outcome) == (sim.tick, sim.score, sim.outcome)
+
+
+def test_replay_ticks_yields_every_tick():
+    sim, data = record(variant_config("quantumquest"), 5, random_policy, max_ticks=100)
+    ticks = [replayed.tick for replayed in replay_ticks(Recording(data))]
+    assert ticks[:sim.tick + 1] == list(range(sim.tick + 1))
+
+
+def test_recording_keeps_the_settings():
+    config = variant_config("gravity_quest", gravity=0.7)
+    _, data = record(config, 2, random_policy, max_ticks=50)
+    assert vars(Recording(data).config) == vars(config)
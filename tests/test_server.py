@@ -0,0 +1,83 @@
+import struct
+
+from frog_server import MAX_BUFFERED, UPDATE, Match, MatchServer
+from frog_sim import DOWN, JUMP, LEFT, RIGHT, Simulation
+from frog_variants import variant_config
+
+
+class FakeTransport:
+    def __init__(self):
+        self.buffered = 0
+
+    def get_write_buffer_size(self):
+        return self.buffered
+
+
+class FakeWriter:
+    def __init__(self):
+        self.transport = FakeTransport()
+        self.updates = []
+        self.closed = False
+
+    def write(self, data):
+        self.updates.append(data)
+
+    def close(self):
+        self.closed = True
+
+
+def client_match(server, seed=1):
+    writer = FakeWriter()
+    match = Match(0, variant_config("game"), seed, writer)
+    server.matches += 1
+    return match, writer
+
+
+def test_update_layout():
+    server = MatchServer()
+    match, writer = client_match(server)
+    match.tick()
+    assert server.finish_tick(match)
+    data = writer.updates[0]
+    size, tick = UPDATE.unpack_from(data)[:2]
+    assert size + 2 == len(data)
+    assert tick == 1
+    logs = struct.unpack_from(f"<{match.sim.num_logs}f", data, UPDATE.size)
+    assert logs[0] == struct.unpack("<f", struct.pack("<f", match.sim.rects[0]))[0]
+
+
+def test_slow_clients_miss_updates_but_not_the_last():
+    server = MatchServer()
+    match, writer = client_match(server)
+    writer.transport.buffered = MAX_BUFFERED + 1
+    for _ in range(5):
+        match.tick()
+        assert server.finish_tick(match)
+    assert writer.updates == []
+    assert server.skipped == 5
+
+    writer.transport.buffered = 0
+    match.tick()
+    server.finish_tick(match)
+    assert len(writer.updates) == 1
+
+    writer.transport.buffered = MAX_BUFFERED + 1
+    while match.sim.outcome is None:
+        match.tick()
+    assert not server.finish_tick(match)
+    assert len(writer.updates) == 2  # The game-over update still goes out
+    assert match.closed and writer.closed
+
+
+def test_key_presses_are_folded_as_they_arrive():
+    server = MatchServer()
+    match, _ = client_match(server)
+    other = Simulation(variant_config("game"), 1)
+    presses = [bytes([RIGHT, RIGHT, JUMP, 9]), bytes([LEFT, RIGHT, DOWN, JUMP]) * 1000, bytes([RIGHT])]
+    for data in presses:
+        match.press(data)
+    assert (match.steps, match.jump, match.fall) == (3, True, True)
+    match.tick()
+    other.step(list(b"".join(presses)))
+    assert match.sim.rects == other.rects
+    assert (match.steps, match.jump, match.fall) == (0, False, False)
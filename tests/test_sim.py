@@ -0,0 +1,105 @@
+import pytest
+
+from conftest import scripted_inputs
+from frog_sim import DOWN, JUMP, LEFT, LOSE, RIGHT, Simulation, coalesce_inputs
+from frog_variants import VARIANTS, variant_config
+
+
+def play(config, seed, inputs):
+    sim = Simulation(config, seed)
+    for tick_inputs in inputs:
+        sim.step(tick_inputs)
+    return sim
+
+
+def test_seeded_games_are_deterministic(variant):
+    inputs = scripted_inputs(1, 400)
+    a = play(variant_config(variant), 7, inputs)
+    b = play(variant_config(variant), 7, inputs)
+    assert a.rects == b.rects
+    assert (a.tick, a.score, a.outcome) == (b.tick, b.score, b.outcome)
+
+
+def frozen_game(name, **overrides):
+    """A game whose logs stand still, with the knight above the first log of a row."""
+    sim = Simulation(variant_config(name, **overrides), 1)
+    for slot in range(sim.num_logs):
+        sim.log_speeds[slot] = 0
+    return sim
+
+
+def test_fast_fall_stops_at_the_first_log():
+    # Falls far enough in one tick to end inside a log three rows down
+    sim = frozen_game("quantumquest")
+    cfg = sim.config
+    log = 4 * sim.log_slot(5, 0)
+    sim.set_rect(sim.knight, sim.rects[log] + 10, cfg.row_y(5) - 40 - cfg.knight_height,
+                 cfg.knight_width, cfg.knight_height)
+    sim.velocity_y = 249.5
+    sim.step()
+    assert sim.rects[4 * sim.knight + 3] == cfg.row_y(5)
+    sim.step()
+    assert sim.on_log and sim.velocity_y == 0
+    assert sim.get_knight_row() == 5
+
+
+def test_fast_ball_hits_the_knight_it_passes():
+    sim = frozen_game("quantumquest", ball_speed=90, ball_spawn_chance=0)
+    k = 4 * sim.knight
+    ball = sim.free_balls.pop()
+    sim.set_rect(ball, sim.rects[k] + 10, sim.rects[k + 1] - 50, 10, 10)
+    sim.balls.append(ball)
+    sim.step()
+    assert sim.score == -sim.config.ball_penalty
+    assert not sim.balls
+
+
+@pytest.mark.parametrize("name", sorted(name for name, settings in VARIANTS.items()
+                                        if not settings.get("log_collisions")))
+def test_log_state_matches_stepping(name):
+    sim = Simulation(variant_config(name), 5)
+    predicted = {tick: [sim.log_state(slot, tick) for slot in range(sim.num_logs)] for tick in range(1, 600)}
+    for tick in range(1, 600):
+        sim.move_logs()  # Just the logs: the knight may lose long before
+        for slot, (x1, speed) in enumerate(predicted[tick]):
+            assert sim.rects[4 * slot] == pytest.approx(x1, abs=1e-6)
+            assert sim.log_speeds[slot] == pytest.approx(speed)
+
+
+def test_endless_scroll_keeps_the_tower():
+    # Rows are generated from their depth, so the same seed builds the same tower however it scrolls
+    a = Simulation(variant_config("endless"), 9)
+    b = Simulation(variant_config("endless"), 9)
+    a.scroll(1)
+    a.scroll(2)
+    b.scroll(3)
+    assert a.rects[:4 * a.num_logs] == b.rects[:4 * b.num_logs]
+    assert a.log_speeds == b.log_speeds
+    assert a.rows_climbed == b.rows_climbed == 3
+
+
+def test_finished_game_ignores_inputs():
+    sim = Simulation(variant_config("game"), 1)
+    while sim.outcome is None:
+        sim.step()
+    assert sim.outcome == LOSE
+    # Put the chest right next to the knight: a move would collect it
+    k = 4 * sim.knight
+    sim.set_rect(sim.chest, sim.rects[k] + sim.config.move_step, sim.rects[k + 1], 30, 30)
+    rects, score, tick = sim.rects[:], sim.score, sim.tick
+    sim.step([RIGHT, JUMP])
+    sim.apply_inputs([LEFT, DOWN])
+    assert sim.rects == rects
+    assert (sim.score, sim.tick) == (score, tick)
+
+
+@pytest.mark.parametrize("inputs", [
+    [], [LEFT], [RIGHT, RIGHT, LEFT], [JUMP, RIGHT, JUMP], [DOWN, LEFT, LEFT, JUMP, DOWN], [LEFT, RIGHT],
+])
+def test_coalesced_inputs_apply_like_the_originals(inputs):
+    config = variant_config("quantumquest")
+    a = play(config, 3, [[]] * 5 + [inputs] + [[]] * 5)
+    b = play(config, 3, [[]] * 5 + [coalesce_inputs(inputs)] + [[]] * 5)
+    assert a.rects == b.rects
+    assert a.score == b.score
+    assert coalesce_inputs(coalesce_inputs(inputs)) == coalesce_inputs(inputs)
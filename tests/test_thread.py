@@ -0,0 +1,75 @@
+import threading
+
+from frog_replay import Recorder, Recording, replay
+from frog_sim import JUMP, LEFT, RIGHT, Simulation
+from frog_thread import SimulationThread, StateBuffer
+from frog_variants import variant_config
+
+
+class RacingReader(StateBuffer):
+    """A reader buffer whose first copy races with a whole new tick being published."""
+
+    def __init__(self, sim):
+        super().__init__(sim)
+        self.copies = 0
+
+    def copy_from(self, other):
+        super().copy_from(other)
+        self.copies += 1
+        if self.copies == 1:
+            # The writer rewrites this very buffer while it is being copied
+            other.seq += 1
+            other.tick += 100
+            other.seq += 1
+
+
+def test_latest_copies_the_published_tick():
+    sim = Simulation(variant_config("game"), 2)
+    thread = SimulationThread(sim)
+    for _ in range(3):
+        thread.step()
+    state = thread.latest(StateBuffer(sim))
+    assert state.tick == 3
+    assert state.rects == sim.rects
+
+
+def test_latest_retries_a_copy_that_raced_with_a_write():
+    sim = Simulation(variant_config("game"), 2)
+    thread = SimulationThread(sim)
+    thread.step()
+    reader = RacingReader(sim)
+    state = thread.latest(reader)
+    assert reader.copies == 2
+    assert state.tick == 101  # The torn copy of tick 1 was thrown away
+
+
+def test_latest_waits_for_a_write_in_progress():
+    sim = Simulation(variant_config("game"), 2)
+    thread = SimulationThread(sim)
+    thread.step()
+    front = thread.buffers[thread.front]
+    front.seq += 1  # Caught mid-write
+
+    def finish():
+        front.tick = 7
+        front.seq += 1
+
+    writer = threading.Timer(0.05, finish)
+    writer.start()
+    state = thread.latest(StateBuffer(sim))
+    writer.join()
+    assert state.tick == 7
+
+
+def test_queued_presses_are_coalesced_and_recorded():
+    config = variant_config("quantumquest")
+    sim = Simulation(config, 2)
+    recorder = Recorder(config, 2)
+    thread = SimulationThread(sim, recorder)
+    for presses in ([RIGHT, RIGHT, LEFT, JUMP, JUMP], [], [LEFT], [RIGHT, LEFT]):
+        for action in presses:
+            thread.send(action)
+        thread.step()
+    recording = Recording(recorder.finish(sim))
+    assert recording.events == [(0, RIGHT), (0, JUMP), (2, LEFT)]
+    assert replay(recording).rects == sim.rects
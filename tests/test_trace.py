@@ -0,0 +1,24 @@
+from frog_sim import LOSE, Simulation
+from frog_trace import GAME_OVER, Tracer, read_trace
+from frog_variants import variant_config
+
+
+def test_game_over_is_traced_and_flushes_replace_old_traces(tmp_path):
+    path = tmp_path / "trace.bin"
+    path.write_bytes(b"\0" * 64)  # An old session's trace
+    sim = Simulation(variant_config("game"), 1, Tracer())
+    while sim.outcome is None:
+        sim.step()
+    assert sim.outcome == LOSE
+    sim.tracer.flush(path)
+    events = list(read_trace(path))
+    assert all(kind for _, kind, _, _, _ in events)  # None of the old zeroed records
+    tick, kind, a, b, _ = events[-1]
+    assert (tick, kind, a, b) == (sim.tick, GAME_OVER, sim.knight, 0)
+
+    # Later flushes of the same session append
+    sim.tracer.flush(path)
+    assert list(read_trace(path)) == events
+    sim.tracer.emit_slot(sim.tick, GAME_OVER, sim.knight, 0, sim.rects)
+    sim.tracer.flush(path)
+    assert len(list(read_trace(path))) == len(events) + 1
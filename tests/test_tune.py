@@ -0,0 +1,21 @@
+import argparse
+
+from frog_tune import check_point, run_chunk
+
+
+def args(variant="game", policy="hopper"):
+    return argparse.Namespace(variant=variant, policy=policy, seed=0)
+
+
+def test_run_chunk_counts_every_game():
+    stats = run_chunk("game", {"gravity": 0.6}, "hopper", range(4), 500)
+    assert stats["games"] == 4
+    assert 0 <= stats["wins"] <= 4
+    assert stats["ticks"] > 0
+
+
+def test_check_point_finds_what_the_planner_cannot_play():
+    assert check_point(args(policy="planner"), {}) is None
+    assert check_point(args(policy="planner"), {"bounce_velocity": -5})
+    assert check_point(args("play_play_lol", "planner"), {})
+    assert check_point(args("play_play_lol", "hopper"), {}) is None